@@ -8,48 +8,143 @@ configuration values used throughout the application. It is intended to be the
 single source of truth for all configurable parameters.
 """
 
+import functools
 import logging
 import os
-from typing import List, Optional, Type
-
-from dotenv import load_dotenv
+import re
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Type
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
-# Load environment variables from a .env file at the project root
-# This allows for secure management of API keys and other secrets.
-load_dotenv()
-logger.info(".env file loaded (if present).")
+# Environment flag marking that the .env file has already been loaded in this
+# process, so that re-imports and worker threads never parse it twice.
+_DOTENV_LOADED_FLAG = "_JH_DOTENV_LOADED"
+
+# The .env file lives next to this module, at the project root.
+_DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".env")
+
+
+def _load_env_file(path: str) -> None:
+    """
+    Loads `KEY=VALUE` pairs from a .env file into `os.environ`.
+
+    Blank lines and `#` comments are skipped, and surrounding quotes are
+    removed from values. Variables that are already set in the environment
+    take precedence over the file.
+
+    Args:
+        path (str): The path to the .env file. A missing file is ignored.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return
+
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if key.startswith("export "):
+            key = key[len("export "):].strip()
+        os.environ.setdefault(key, value.strip().strip('"').strip("'"))
+
 
 # --- API Credentials ---
 # These are loaded from environment variables for security.
 # A .env.example file should guide the user in setting these up.
 
-# Use GOOGLE_API_KEY, with a fallback to GEMINI_API_KEY for user convenience
-GOOGLE_API_KEY: Optional[str] = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
-REDDIT_CLIENT_ID: Optional[str] = os.getenv("REDDIT_CLIENT_ID")
-REDDIT_CLIENT_SECRET: Optional[str] = os.getenv("REDDIT_CLIENT_SECRET")
-REDDIT_USER_AGENT: Optional[str] = os.getenv("REDDIT_USER_AGENT")
-
-# --- Validation for Critical Configurations ---
-# The application cannot function without these core credentials.
-_CRITICAL_CONFIGS = {
-    "Google API Key": GOOGLE_API_KEY,
-    "Reddit Client ID": REDDIT_CLIENT_ID,
-    "Reddit Client Secret": REDDIT_CLIENT_SECRET,
-    "Reddit User Agent": REDDIT_USER_AGENT,
-}
-
-for name, value in _CRITICAL_CONFIGS.items():
-    if not value:
-        logger.critical(
-            f"Configuration Error: '{name}' is not set. "
-            "Please check your .env file or environment variables."
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    An immutable snapshot of the environment-provided settings.
+
+    Each environment variable is read exactly once, when the snapshot is built
+    by `get_settings()`. Consumers should access credentials through the cached
+    instance rather than calling `os.getenv` themselves.
+    """
+    google_api_key: Optional[str]
+    reddit_client_id: Optional[str]
+    reddit_client_secret: Optional[str]
+    reddit_user_agent: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Builds and caches the application's environment-provided settings.
+
+    The .env file at the project root is loaded at most once per process. This
+    allows for secure management of API keys and other secrets.
+
+    Returns:
+        Settings: The cached, immutable settings instance.
+    """
+    if not os.environ.get(_DOTENV_LOADED_FLAG):
+        _load_env_file(_DOTENV_PATH)
+        os.environ[_DOTENV_LOADED_FLAG] = "1"
+        logger.info(".env file loaded (if present).")
+
+    settings = Settings(
+        # Use GOOGLE_API_KEY, with a fallback to GEMINI_API_KEY for user convenience
+        google_api_key=os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY"),
+        reddit_client_id=os.getenv("REDDIT_CLIENT_ID"),
+        reddit_client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+        reddit_user_agent=os.getenv("REDDIT_USER_AGENT"),
+    )
+    return settings
+
+
+@functools.lru_cache(maxsize=1)
+def _validate_once() -> None:
+    """
+    Logs any missing critical configuration, at most once per process.
+
+    This is kept out of module import so that `import config` stays cheap; it
+    is run explicitly by `bootstrap()` at application start.
+    """
+    settings = get_settings()
+
+    # --- Validation for Critical Configurations ---
+    # The application cannot function without these core credentials.
+    critical_configs = {
+        "Google API Key": settings.google_api_key,
+        "Reddit Client ID": settings.reddit_client_id,
+        "Reddit Client Secret": settings.reddit_client_secret,
+        "Reddit User Agent": settings.reddit_user_agent,
+    }
+
+    for name, value in critical_configs.items():
+        if not value:
+            logger.critical(
+                f"Configuration Error: '{name}' is not set. "
+                "Please check your .env file or environment variables."
+            )
+            # In a real application, you might want to raise an exception
+            # or exit here to prevent it from running in a broken state.
+            # For now, we just log a critical error.
+
+    if RESUME_FILE_PATH and not os.path.exists(RESUME_FILE_PATH):
+        logger.warning(
+            f"Default resume file not found at: {RESUME_FILE_PATH}. "
+            "Please update the path in the GUI or config.py."
         )
-        # In a real application, you might want to raise an exception
-        # or exit here to prevent it from running in a broken state.
-        # For now, we just log a critical error.
+
+
+def bootstrap() -> None:
+    """
+    Loads and validates the configuration at application start.
+
+    This should be called once from the entry point, before any agents are
+    created. Calling it again is harmless.
+    """
+    _validate_once()
+    logger.info("Configuration loaded and validated.")
 
 # --- Scout Configuration ---
 # This is where we define which scouts to use.
@@ -63,15 +158,16 @@ SCOUTS_TO_USE: List[str] = [
 
 # --- Reddit Scout Configuration ---
 
-# A list of subreddits to scan for job postings.
-SUBREDDITS_TO_SCAN: List[str] = [
+# The subreddits to scan for job postings.
+# Stored as an immutable tuple of interned strings, as it never changes at runtime.
+SUBREDDITS_TO_SCAN: Tuple[str, ...] = tuple(sys.intern(name) for name in (
     "forhire",
     "jobbit",
     "hiring",
     "PythonJobs",
     "remotejs",
     "freelance_for_hire",
-]
+))
 
 # The number of recent posts to fetch from each subreddit per scan.
 REDDIT_POST_LIMIT: int = 25 # Reduced a bit to make scans faster with more sources
@@ -89,9 +185,10 @@ RSS_FEEDS_TO_SCAN: List[str] = [
 
 # --- AI Qualifier Agent Configuration ---
 
-# A list of keywords the AI should prioritize when analyzing job descriptions.
+# The keywords the AI should prioritize when analyzing job descriptions.
 # This helps focus the AI's analysis on roles most relevant to the user's skills.
-AI_QUALIFICATION_KEYWORDS: List[str] = [
+# Stored as an immutable tuple of interned strings, as it never changes at runtime.
+AI_QUALIFICATION_KEYWORDS: Tuple[str, ...] = tuple(sys.intern(keyword) for keyword in (
     "Python",
     "Software Engineer",
     "Developer",
@@ -107,7 +204,38 @@ AI_QUALIFICATION_KEYWORDS: List[str] = [
     "API Integration",
     "LLM",
     "AI",
-]
+))
+
+
+def compile_keyword_regex(keywords: Sequence[str]) -> "re.Pattern[str]":
+    """
+    Compiles keywords into a single case-insensitive, whole-word regex.
+
+    Matching one alternation scans a text once, instead of once per keyword.
+
+    Args:
+        keywords (Sequence[str]): The keywords to match.
+
+    Returns:
+        re.Pattern[str]: The compiled pattern.
+    """
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE
+    )
+
+
+# A precompiled matcher for AI_QUALIFICATION_KEYWORDS. Use
+# `KEYWORD_REGEX.search(text)` or `KEYWORD_REGEX.findall(text)` rather than
+# testing each keyword against the text separately.
+KEYWORD_REGEX: "re.Pattern[str]" = compile_keyword_regex(AI_QUALIFICATION_KEYWORDS)
+
+# The maximum number of characters of a job posting's body sent to the AI
+# (roughly 1500 tokens). Longer posts are truncated before analysis.
+AI_MAX_JOB_BODY_CHARS: int = 6000
+
+# The maximum number of characters of the resume sent with each request
+# (roughly 1200 tokens). It is part of every prompt, so it is capped as well.
+AI_MAX_RESUME_CHARS: int = 4800
 
 # The path to the user's resume file.
 # The content of this file will be used by the AI to tailor cover letters.
@@ -117,16 +245,36 @@ RESUME_FILE_PATH: Optional[str] = "path/to/your/resume.md"
 
 # --- Application Behavior ---
 
+# The directory where persistent caches (e.g. previous LLM analyses) are stored.
+CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "prospector")
+
+# How long, in seconds, a cached LLM analysis of a lead stays valid.
+ANALYSIS_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 7  # 7 days
+
+# The minimum cosine similarity between two leads' embeddings for the score and
+# justification of one to be reused for the other (near-duplicate reposts).
+# Requires numpy. text-embedding-004 rates merely similar job posts (e.g. two
+# different "remote Python developer" ads) well above 0.9, so this is kept
+# conservative, to catch reworded reposts only.
+SEMANTIC_CACHE_THRESHOLD: float = 0.97
+
+# The maximum number of analyses kept in the semantic cache.
+SEMANTIC_CACHE_MAX_ENTRIES: int = 5000
+
+# How long, in seconds, scouts may reuse a cached HTTP response (requires the
+# optional `requests-cache` package). Keep it below the auto-refresh interval,
+# or refreshes will keep showing the same listings.
+HTTP_CACHE_EXPIRE_SECONDS: int = 60 * 5  # 5 minutes
+
 # The maximum number of concurrent threads to use for scraping/analysis tasks.
 MAX_WORKER_THREADS: int = 4
 
+# The maximum number of LLM analysis requests in flight at once during a scan.
+MAX_CONCURRENT_ANALYSES: int = 16
+
+# The deadline, in seconds, for a single LLM or embedding request.
+AI_REQUEST_TIMEOUT_SECONDS: float = 60.0
+
 # The delay in seconds between automatic refresh cycles.
 # Set to None to disable automatic refresh.
-AUTO_REFRESH_INTERVAL_SECONDS: Optional[int] = 60 * 15  # 15 minutes
-
-logger.info("Configuration constants defined.")
-if RESUME_FILE_PATH and not os.path.exists(RESUME_FILE_PATH):
-    logger.warning(
-        f"Default resume file not found at: {RESUME_FILE_PATH}. "
-        "Please update the path in the GUI or config.py."
-    )
\ No newline at end of file
+AUTO_REFRESH_INTERVAL_SECONDS: Optional[int] = 60 * 15  # 15 minutes
\ No newline at end of file
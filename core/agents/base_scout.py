@@ -10,9 +10,10 @@ that the core application logic can interact with any job source in a
 standardized way.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Optional
 from dataclasses import dataclass
 
 
@@ -20,13 +21,15 @@ from dataclasses import dataclass
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobLead:
     """
     A standardized data structure for a potential job lead.
 
     This class ensures that no matter the source (Reddit, RSS, etc.), the data
-    passed to the QualifierAgent has a consistent structure.
+    passed to the QualifierAgent has a consistent structure. Leads are
+    immutable and slotted, which keeps large scans light on memory and makes
+    leads usable as dictionary keys or set members.
     """
     id: str
     title: str
@@ -44,14 +47,20 @@ class BaseScout(ABC):
     interface that all scouts must implement.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http_session: Optional[Any] = None) -> None:
         """
         Initializes the BaseScout.
 
         This constructor can be extended by subclasses to handle specific
         setup requirements, such as initializing API clients.
+
+        Args:
+            http_session (Optional[Any]): A shared `requests.Session` (e.g. a
+                caching one) for scouts whose clients use `requests`. Scouts
+                that don't use `requests` ignore it.
         """
-        logger.info(f"Initializing {self.__class__.__name__}.")
+        self.http_session = http_session
+        logger.info("Initializing %s.", self.__class__.__name__)
 
     @abstractmethod
     def find_leads(self) -> List[JobLead]:
@@ -65,10 +74,25 @@ class BaseScout(ABC):
 
         Each implementation is responsible for its own error handling and should
         return an empty list if no leads can be found or an unrecoverable
-        error occurs.
+        error occurs. Leads without any body text must be left out, as they
+        cannot be qualified.
 
         Returns:
             List[JobLead]: A list of `JobLead` objects. The QualifierAgent will
                            process this standardized list.
         """
-        pass
\ No newline at end of file
+        pass
+
+    async def find_leads_async(self) -> List[JobLead]:
+        """
+        Asynchronous counterpart of `find_leads`, used by the worker.
+
+        The default implementation runs `find_leads` in a thread, so blocking
+        clients (PRAW, feedparser) don't stall the event loop and several
+        scouts run in parallel. Scouts built on an async client can override
+        this to fetch natively on the loop.
+
+        Returns:
+            List[JobLead]: The same leads `find_leads` returns.
+        """
+        return await asyncio.to_thread(self.find_leads)
\ No newline at end of file
@@ -4,28 +4,362 @@ To implement the LLM-based agent responsible for analyzing job descriptions,
 assigning relevance scores, and generating draft cover letters.
 """
 
+import asyncio
+import functools
+import hashlib
 import logging
 import json
-from typing import Dict, Optional, Any, List
+import os
+import re
+import threading
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+)
+
+# Optional dependencies
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:
+    # Fall back to a single compiled regex for the keyword pre-filter.
+    ahocorasick = None
 
-# External dependencies
 try:
-    import google.generativeai as genai
-    from google.api_core import exceptions as google_exceptions
-    # PRAW models are no longer used here, but we need JobLead
-except ImportError as e:
-    # This will be caught at a higher level, but logging is good practice.
-    logging.critical(f"Missing critical dependency: {e}. The QualifierAgent may not function.")
-    # Define dummy classes for type hinting if imports fail
-    genai = None # To prevent further errors
+    import orjson
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+    # error handling covers both parsers.
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Project-specific imports
 import config
 from core.agents.base_scout import JobLead
+from core.cache import ResultCache
+from core.semantic_cache import SemanticCache
+
+# Note: `google.generativeai` and `google.api_core` are imported lazily in
+# `QualifierAgent.__init__`, as they pull in gRPC and protobuf at import time.
 
 
 logger = logging.getLogger(__name__)
 
+# The Gemini model used for analysis. It is part of the result-cache key.
+_MODEL_NAME = "gemini-1.5-flash-latest"
+
+# The embedding model used to find near-duplicate leads in the semantic cache.
+_EMBEDDING_MODEL = "models/text-embedding-004"
+
+# The maximum number of texts the Gemini API embeds in a single request.
+_EMBEDDING_BATCH_SIZE = 100
+
+# The keys every LLM response must contain to be considered valid.
+_REQUIRED_KEYS = frozenset({"score", "justification", "cover_letter_draft"})
+
+# The parts of an analysis that may be reused for a near-duplicate lead. The
+# rest (company, contact, cover letter) is specific to the posting it came from.
+_SEMANTIC_REUSE_KEYS = ("score", "justification")
+
+# Prepended to a reused justification, so the user knows why the cover letter,
+# company and contact of such a lead are empty.
+_SEMANTIC_REUSE_NOTE = (
+    "Reused from the analysis of a near-identical posting. No cover letter, "
+    "company or contact was extracted for this one."
+)
+
+# The system instruction sent with every request.
+_SYSTEM_MSG = (
+    "You are an expert career assistant. Your task is to analyze a job posting "
+    "based on a user's resume and skills. You MUST respond with a single, "
+    "valid JSON object and nothing else. The JSON object must have the "
+    "following structure: {\"score\": <integer>, \"justification\": \"<string>\", "
+    "\"cover_letter_draft\": \"<string>\", \"extracted_company_name\": "
+    "\"<string or null>\", \"extracted_contact_info\": \"<string or null>\"}."
+)
+
+# The per-lead prompt. Only the slots are filled in per call, with a single
+# %-format operation (see `QualifierAgent._create_prompt`).
+_PROMPT_TMPL = """
+Analyze the following job posting based on my skills and resume.
+
+**My Key Skills/Interests:**
+%(kw)s
+
+**My Resume/CV:**
+%(resume)s
+
+**Job Posting to Analyze:**
+Title: %(title)s
+Body:
+%(body)s
+
+---
+**Your Task:**
+Based on all the information, evaluate the job posting's relevance to my profile.
+Provide a relevance score from 0 (not relevant) to 100 (perfect match).
+Write a brief justification for your score.
+Draft a concise, professional, and tailored cover letter.
+Extract the company name and any contact information if available.
+
+Return a single, valid JSON object with the following exact structure:
+{
+  "score": <integer, 0-100>,
+  "justification": "<string, your reasoning for the score>",
+  "cover_letter_draft": "<string, the drafted cover letter text>",
+  "extracted_company_name": "<string or null, the company name if found>",
+  "extracted_contact_info": "<string or null, email or contact person if found>"
+}
+""".strip()
+
+# Substitutions applied in order by `_compress` to trim prompt tokens. Verbose
+# phrases are shortened and filler words dropped; neither changes what the
+# model is asked to judge. Markdown tables are flattened and whitespace runs
+# collapsed last, so removed words leave no gaps behind.
+_COMPRESSIONS: Tuple[Tuple["re.Pattern[str]", str], ...] = tuple(
+    (re.compile(pattern, flags), replacement)
+    for pattern, replacement, flags in (
+        (r"\bin order to\b", "to", re.IGNORECASE),
+        (r"\bdue to the fact that\b", "because", re.IGNORECASE),
+        (r"\bfor the purpose of\b", "for", re.IGNORECASE),
+        (r"\bin the event that\b", "if", re.IGNORECASE),
+        (r"\bat this point in time\b", "now", re.IGNORECASE),
+        (r"\bwith regard to\b", "about", re.IGNORECASE),
+        (r"\b(?:has|have) the ability to\b", "can", re.IGNORECASE),
+        (r"\bworked closely with\b", "worked with", re.IGNORECASE),
+        (r"\bI would like to\s+", "", re.IGNORECASE),
+        # Only before whitespace, so no stray punctuation is left behind
+        # ("Really great, actually." keeps its final "actually.").
+        (r"\b(?:please|basically|actually|really)\b,?[ \t]+", "", re.IGNORECASE),
+        # Markdown tables: drop separator rows and outer pipes, then turn the
+        # remaining cell borders into plain separators.
+        (r"^[ \t]*\|?(?:[ \t]*:?-+:?[ \t]*\|)+[ \t]*(?::?-+:?)?[ \t]*$\n?", "", re.MULTILINE),
+        (r"^[ \t]*\|[ \t]*|[ \t]*\|[ \t]*$", "", re.MULTILINE),
+        (r"[ \t]*\|[ \t]*", "; ", 0),
+        (r"[ \t]+", " ", 0),
+        (r" ?\n ?", "\n", 0),
+        (r"\n{3,}", "\n\n", 0),
+    )
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_resume(path: str, mtime_ns: int) -> str:
+    """
+    Reads the text content of a resume file (.pdf, .txt, or .md).
+
+    The `mtime_ns` argument is not used directly; it is part of the cache key so
+    that an edited resume is re-read automatically.
+
+    Args:
+        path (str): The path to the resume file.
+        mtime_ns (int): The file's modification time in nanoseconds.
+
+    Returns:
+        str: The extracted text of the resume.
+    """
+    if path.lower().endswith(".pdf"):
+        import fitz  # PyMuPDF
+
+        with fitz.open(path) as doc:
+            return "".join(page.get_text() for page in doc)
+
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def _compress(text: str) -> str:
+    """
+    Shrinks text for a prompt without changing its meaning.
+
+    Verbose phrases and filler words are shortened or removed, markdown tables
+    are flattened, and runs of whitespace and blank lines are collapsed.
+
+    Args:
+        text (str): The text to compress, e.g. a resume or a job body.
+
+    Returns:
+        str: The compressed text.
+    """
+    for pattern, replacement in _COMPRESSIONS:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    """
+    Caps text at `max_chars`, cutting at a word boundary where possible.
+
+    Gemini's tokenizer is only reachable through an API call, so the budget is
+    expressed in characters (roughly four per token for English text).
+
+    Args:
+        text (str): The text to cap.
+        max_chars (int): The maximum number of characters to keep.
+
+    Returns:
+        str: The text, followed by a truncation marker if it was cut.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind(" ", max_chars // 2, max_chars)
+    return text[:cut if cut > 0 else max_chars].rstrip() + "… [truncated]"
+
+
+def _chunk_text(chunk: Any) -> str:
+    """
+    Returns the text of a streamed response chunk.
+
+    Accessing `.text` raises a ValueError for chunks without text parts (for
+    example, a final chunk carrying only a finish reason); those count as empty.
+    """
+    try:
+        return chunk.text
+    except ValueError:
+        return ""
+
+
+def _is_word_char(char: str) -> bool:
+    """Returns True if `char` counts as part of a word, like regex `\\w`."""
+    return char.isalnum() or char == "_"
+
+
+def _build_keyword_matcher(keywords: Sequence[str]) -> Optional[Callable[[str], bool]]:
+    """
+    Builds a function reporting whether a text contains any of the keywords.
+
+    An Aho-Corasick automaton is used when `pyahocorasick` is installed, so the
+    text is scanned once regardless of the number of keywords. Otherwise, all
+    keywords are compiled into one alternation regex.
+
+    Args:
+        keywords (Sequence[str]): The keywords to match, case-insensitively.
+
+    Returns:
+        Optional[Callable[[str], bool]]: The matcher, or None if there are no
+                                         keywords (in which case nothing is
+                                         filtered out).
+    """
+    keywords = [k.lower() for k in keywords if k]
+    if not keywords:
+        return None
+
+    if ahocorasick is None:
+        pattern = config.compile_keyword_regex(keywords)
+        return lambda text: pattern.search(text) is not None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, len(keyword))
+    automaton.make_automaton()
+
+    def _matches(text: str) -> bool:
+        haystack = text.lower()
+        last = len(haystack) - 1
+        for end, length in automaton.iter(haystack):
+            start = end - length + 1
+            # Only accept whole-word matches, e.g. "AI" must not match "email".
+            if start > 0 and _is_word_char(haystack[start - 1]):
+                continue
+            if end < last and _is_word_char(haystack[end + 1]):
+                continue
+            return True
+        return False
+
+    return _matches
+
+
+def _prompt_cache_key(prompt: str) -> str:
+    """
+    Computes the result-cache key for a prompt.
+
+    The key covers the model name and the complete prompt, so a changed resume,
+    keyword list or prompt template never returns a stale analysis, while the
+    same posting found again (for example, a repost in another subreddit) maps
+    to the same key.
+
+    Args:
+        prompt (str): The fully formatted prompt.
+
+    Returns:
+        str: A hexadecimal SHA-256 digest.
+    """
+    return hashlib.sha256(f"{_MODEL_NAME}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _semantic_context(keywords_str: str, resume_section: str) -> str:
+    """
+    Computes the semantic-cache context key for a resume and keyword list.
+
+    Similar leads only share an analysis if it was made against the same
+    resume, keywords and model, so lookups are scoped to this key.
+
+    Args:
+        keywords_str (str): The formatted keyword list.
+        resume_section (str): The formatted resume section of the prompt.
+
+    Returns:
+        str: A hexadecimal SHA-256 digest.
+    """
+    payload = f"{_MODEL_NAME}\0{keywords_str}\0{resume_section}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _as_score(value: Any) -> int:
+    """Converts the LLM's score (an int, float or numeric string) to an int, or 0."""
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _embedding_text(lead: JobLead) -> str:
+    """Returns the text of a lead that is embedded for the semantic cache."""
+    return f"{lead.title}\n{lead.body}"[:config.AI_MAX_JOB_BODY_CHARS]
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzedJob:
+    """
+    The result of qualifying a `JobLead`: the lead's identity plus the LLM's
+    assessment. Slotted and immutable, like `JobLead`, so a large scan's
+    results stay light and can be handed to the GUI thread without copying.
+    """
+    id: str
+    title: str
+    url: str
+    source: str
+    score: int
+    justification: str
+    cover_letter: str
+    company_name: Optional[str]
+    contact_info: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingLead:
+    """A lead that missed the result cache, with the prompt prepared for it."""
+    lead: JobLead
+    prompt: str
+    cache_key: str
+
+
+def get_resume_content(path: str) -> str:
+    """
+    Returns the content of a resume file, re-reading it only if it changed.
+
+    Args:
+        path (str): The path to the resume file.
+
+    Returns:
+        str: The text content of the resume.
+
+    Raises:
+        OSError: If the file cannot be accessed or read.
+    """
+    return _load_resume(path, os.stat(path).st_mtime_ns)
+
 
 class QualifierAgent:
     """
@@ -44,7 +378,25 @@ class QualifierAgent:
         generative model. If the key is not found, the agent will be in a disabled state.
         """
         self.model: Optional["GenerativeModel"] = None
-        if not config.GOOGLE_API_KEY:
+        self._cache = ResultCache(os.path.join(config.CACHE_DIR, "qualifier.sqlite"))
+        # Catches reworded reposts that miss the exact prompt-keyed cache.
+        self._semantic_cache = SemanticCache(
+            os.path.join(config.CACHE_DIR, "semantic"),
+            threshold=config.SEMANTIC_CACHE_THRESHOLD,
+            max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+        )
+        # The keyword list is identical for every lead, so it is joined once
+        # here rather than in `_create_prompt`.
+        self._keywords_str = ", ".join(config.AI_QUALIFICATION_KEYWORDS)
+        self._keyword_matcher = _build_keyword_matcher(config.AI_QUALIFICATION_KEYWORDS)
+        self._genai: Any = None
+        self._gexc: Any = None
+        self._gen_config: Any = None
+        # Bounds every request, so a stalled connection can't hold a
+        # concurrency slot for the rest of the scan.
+        self._request_options = {"timeout": config.AI_REQUEST_TIMEOUT_SECONDS}
+        settings = config.get_settings()
+        if not settings.google_api_key:
             logger.critical(
                 "GOOGLE_API_KEY not found in config/.env. "
                 "QualifierAgent will be non-functional."
@@ -52,190 +404,539 @@ class QualifierAgent:
             return
 
         try:
-            genai.configure(api_key=config.GOOGLE_API_KEY)
-
-            system_instruction = (
-                "You are an expert career assistant. Your task is to analyze a job posting "
-                "based on a user's resume and skills. You MUST respond with a single, "
-                "valid JSON object and nothing else. The JSON object must have the "
-                "following structure: {\"score\": <integer>, \"justification\": \"<string>\", "
-                "\"cover_letter_draft\": \"<string>\", \"extracted_company_name\": "
-                "\"<string or null>\", \"extracted_contact_info\": \"<string or null>\"}."
-            )
+            import google.generativeai as genai
+            from google.api_core import exceptions as google_exceptions
+        except ImportError as e:
+            logger.critical(f"Missing critical dependency: {e}. The QualifierAgent may not function.")
+            return
+
+        self._genai = genai
+        self._gexc = google_exceptions
+        # Configure the model for JSON output and a balanced temperature. The
+        # config is immutable, so a single instance is shared by every request.
+        self._gen_config = genai.types.GenerationConfig(
+            response_mime_type="application/json",
+            temperature=0.5
+        )
+
+        try:
+            # No transport is passed: the SDK already defaults to gRPC (HTTP/2)
+            # for sync calls and grpc_asyncio for the async client. Forcing
+            # "grpc" would hand the async client a sync transport.
+            genai.configure(api_key=settings.google_api_key)
 
             # Using a fast and capable model, with system instructions for consistent output
             self.model = genai.GenerativeModel(
-                model_name="gemini-1.5-flash-latest",
-                system_instruction=system_instruction
+                model_name=_MODEL_NAME,
+                system_instruction=_SYSTEM_MSG
             )
-            # A simple test to ensure the client is configured correctly
-            # This is a lightweight call that doesn't consume credits.
-            genai.list_models()
+            # Credentials are not checked here; the first real call surfaces an
+            # authentication error.
             logger.info("Google Gemini client initialized successfully.")
-        except google_exceptions.PermissionDenied as e:
-            logger.critical(
-                f"Google API authentication failed. Please check your API key. Error: {e}"
-            )
-            self.model = None
         except Exception as e:
             logger.critical(
                 f"Failed to initialize Google Gemini client. Error: {e}", exc_info=True
             )
             self.model = None
 
-    def _create_prompt(
-        self, job_title: str, job_body: str, resume_content: str, keywords: List[str]
-    ) -> str:
+    def prepare_resume(self, resume_content: str) -> str:
+        """
+        Formats the resume block of the prompt.
+
+        The resume is the same for every lead in a scan, so callers format it
+        once with this method and pass the result to the analysis methods.
+
+        Args:
+            resume_content (str): The text content of the user's resume.
+
+        Returns:
+            str: The compressed resume section to embed in each prompt. The
+                 resume is capped at `config.AI_MAX_RESUME_CHARS`.
+        """
+        # The user's resume might be empty or not provided.
+        if resume_content and resume_content.strip():
+            resume = _truncate(_compress(resume_content), config.AI_MAX_RESUME_CHARS)
+            return f"Here is my resume for context:\n\n---\n{resume}\n---"
+        return "No resume provided."
+
+    def _create_prompt(self, job_title: str, job_body: str, resume_section: str) -> str:
         """
         Constructs the detailed prompt for the LLM.
 
+        Only the per-lead slots are filled in here; the template, the keyword
+        list and the resume section are all prepared ahead of time. The job
+        body is compressed (see `_compress`) and capped at
+        `config.AI_MAX_JOB_BODY_CHARS` to bound the prompt's token count.
+
         Args:
             job_title (str): The title of the job posting.
             job_body (str): The body text of the job posting.
-            resume_content (str): The user's resume text.
-            keywords (List[str]): A list of user-defined keywords.
+            resume_section (str): The resume section from `prepare_resume`.
 
         Returns:
             str: The fully formatted prompt to be sent to the LLM.
         """
-        keywords_str = ", ".join(keywords)
+        job_body = _truncate(_compress(job_body), config.AI_MAX_JOB_BODY_CHARS)
 
-        # The user's resume might be empty or not provided.
-        resume_section = "No resume provided."
-        if resume_content and resume_content.strip():
-            resume_section = f"Here is my resume for context:\n\n---\n{resume_content}\n---"
+        return _PROMPT_TMPL % {
+            "kw": self._keywords_str,
+            "resume": resume_section,
+            "title": job_title,
+            "body": job_body,
+        }
 
-        prompt = f"""
-Analyze the following job posting based on my skills and resume.
+    def _can_analyze(self, lead: JobLead) -> bool:
+        """
+        Checks whether a lead can and should be analyzed.
 
-**My Key Skills/Interests:**
-{keywords_str}
+        Args:
+            lead (JobLead): The standardized lead object from any scout.
 
-**My Resume/CV:**
-{resume_section}
+        Returns:
+            bool: True if the lead should be analyzed, False if it is skipped.
+        """
+        if not self.model:
+            logger.warning("QualifierAgent not initialized. Skipping analysis.")
+            return False
 
-**Job Posting to Analyze:**
-Title: {job_title}
-Body:
-{job_body}
+        # Scouts never return leads with an empty body (see `BaseScout.find_leads`).
 
----
-**Your Task:**
-Based on all the information, evaluate the job posting's relevance to my profile.
-Provide a relevance score from 0 (not relevant) to 100 (perfect match).
-Write a brief justification for your score.
-Draft a concise, professional, and tailored cover letter.
-Extract the company name and any contact information if available.
+        if not self._prefilter(lead):
+            logger.info("Lead '%s' matches none of the keywords. Skipping analysis.", lead.title)
+            return False
 
-Return a single, valid JSON object with the following exact structure:
-{{
-  "score": <integer, 0-100>,
-  "justification": "<string, your reasoning for the score>",
-  "cover_letter_draft": "<string, the drafted cover letter text>",
-  "extracted_company_name": "<string or null, the company name if found>",
-  "extracted_contact_info": "<string or null, email or contact person if found>"
-}}
-"""
-        return prompt.strip()
+        return True
 
-    def analyze_and_qualify(
-        self, lead: JobLead, resume_content: str
-    ) -> Optional[Dict[str, Any]]:
+    def _prefilter(self, lead: JobLead) -> bool:
         """
-        Analyzes a single job lead, scores it, and generates a cover letter.
+        Cheaply checks whether a lead mentions at least one qualification keyword.
 
-        This method takes a standardized `JobLead` object, sends its content
-        to the Google Gemini API for analysis, and parses the structured JSON
-        response.
+        Leads that match no keyword at all would score near zero anyway, so they
+        are dropped before paying for an LLM call. The keywords are matched
+        case-insensitively as whole words, in a single pass over the text.
 
         Args:
-            lead (JobLead): The standardized lead object from any scout.
-            resume_content (str): The text content of the user's resume.
+            lead (JobLead): The lead to check.
 
         Returns:
-            Optional[Dict[str, Any]]: A dictionary containing the analyzed data,
-                                      including score, justification, cover letter,
-                                      and original lead info. Returns None if
-                                      analysis fails, the lead is invalid, or
-                                      the agent is not initialized.
+            bool: True if at least one keyword occurs in the title or body.
         """
-        if not self.model:
-            logger.warning("QualifierAgent not initialized. Skipping analysis.")
-            return None
+        if self._keyword_matcher is None:
+            return True
+        return self._keyword_matcher(f"{lead.title}\n{lead.body}")
 
-        # If the post body is empty, it's unlikely to be a valid job post.
-        if not lead.body.strip():
-            logger.info(f"Lead '{lead.title}' has no body text. Skipping analysis.")
+    def _get_cached(self, cache_key: str, lead: JobLead) -> Optional[AnalyzedJob]:
+        """
+        Returns the analyzed job for a lead from the result cache, if present.
+
+        Args:
+            cache_key (str): The cache key of the lead's prompt.
+            lead (JobLead): The lead being analyzed.
+
+        Returns:
+            Optional[AnalyzedJob]: The analyzed job, or None on a cache miss.
+        """
+        llm_data = self._cache.get(cache_key)
+        if llm_data is None:
             return None
+        logger.info("Using cached analysis for lead: %s (from %s)", lead.title, lead.source)
+        return self._build_result(lead, llm_data)
 
-        logger.info(f"Analyzing lead: {lead.title} (from {lead.source})")
+    def _split_cached(
+        self, leads: Sequence[JobLead], resume_section: str
+    ) -> Tuple[List[Tuple[JobLead, Optional[AnalyzedJob]]], List[_PendingLead]]:
+        """
+        Separates the leads that can be answered without calling the model.
 
-        prompt = self._create_prompt(
-            lead.title, lead.body, resume_content, config.AI_QUALIFICATION_KEYWORDS
-        )
+        Leads that are skipped by the pre-filter or found in the result cache
+        are resolved right away, so they never wait for a concurrency slot or
+        an embedding request. The prompt and cache key built for the other
+        leads are kept, so they aren't computed again for the model call.
 
-        response_content = None # Initialize for the except block
-        try:
-            # Configure the model for JSON output and a balanced temperature
-            generation_config = genai.types.GenerationConfig(
-                response_mime_type="application/json",
-                temperature=0.5
-            )
+        Args:
+            leads (Sequence[JobLead]): The leads about to be analyzed.
+            resume_section (str): The resume section from `prepare_resume`.
+
+        Returns:
+            Tuple[List[Tuple[JobLead, Optional[AnalyzedJob]]], List[_PendingLead]]:
+                The resolved leads with their results (None if skipped), and
+                the leads that still need the model.
+        """
+        resolved: List[Tuple[JobLead, Optional[AnalyzedJob]]] = []
+        pending: List[_PendingLead] = []
+        for lead in leads:
+            if not self._can_analyze(lead):
+                resolved.append((lead, None))
+                continue
+            prompt = self._create_prompt(lead.title, lead.body, resume_section)
+            cache_key = _prompt_cache_key(prompt)
+            cached = self._get_cached(cache_key, lead)
+            if cached is not None:
+                resolved.append((lead, cached))
+            else:
+                pending.append(_PendingLead(lead, prompt, cache_key))
+        return resolved, pending
+
+    async def _prefetch_embeddings(self, leads: Sequence[JobLead]) -> Dict[JobLead, List[float]]:
+        """
+        Embeds the given leads for the semantic cache in as few requests as possible.
+
+        Args:
+            leads (Sequence[JobLead]): The leads that still need the model (see
+                                       `_split_cached`).
 
-            response = self.model.generate_content(
-                prompt,
-                generation_config=generation_config,
+        Returns:
+            Dict[JobLead, List[float]]: The embedding of each lead that was
+                                        embedded. Leads whose batch failed are
+                                        absent.
+        """
+        if not self.model or not self._semantic_cache.enabled:
+            return {}
+
+        pending = list(dict.fromkeys(leads))
+
+        embeddings: Dict[JobLead, List[float]] = {}
+        for start in range(0, len(pending), _EMBEDDING_BATCH_SIZE):
+            batch = pending[start:start + _EMBEDDING_BATCH_SIZE]
+            try:
+                response = await self._genai.embed_content_async(
+                    model=_EMBEDDING_MODEL,
+                    content=[_embedding_text(lead) for lead in batch],
+                    task_type="semantic_similarity",
+                    request_options=self._request_options,
+                )
+            except Exception as e:
+                logger.warning("Could not embed %d leads for the semantic cache: %s", len(batch), e)
+                continue
+            # Embeddings are returned in the same order as the input texts.
+            embeddings.update(zip(batch, response["embedding"]))
+
+        if pending:
+            logger.info(
+                "Embedded %d of %d leads for the semantic cache.", len(embeddings), len(pending)
             )
+        return embeddings
+
+    def _get_similar(
+        self, embedding: Optional[List[float]], context: str, lead: JobLead
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the LLM data for a lead from the semantic cache, if present.
+
+        Only the score and justification of the near-duplicate are reused. The
+        company, contact and cover letter belong to the other posting, so they
+        are left empty rather than shown for this one, and the justification
+        says so (see `_SEMANTIC_REUSE_NOTE`).
+
+        Args:
+            embedding (Optional[List[float]]): The lead's embedding, if any.
+            context (str): The semantic-cache context key of the scan.
+            lead (JobLead): The lead being analyzed.
+
+        Returns:
+            Optional[Dict[str, Any]]: The reused LLM data, or None on a cache
+                                      miss.
+        """
+        if embedding is None:
+            return None
+        cached = self._semantic_cache.lookup(embedding, context)
+        if cached is None:
+            return None
+        # Entries written by older versions hold the complete payload.
+        llm_data = {key: cached[key] for key in _SEMANTIC_REUSE_KEYS if key in cached}
+        llm_data["justification"] = (
+            f"{_SEMANTIC_REUSE_NOTE}\n\n{llm_data.get('justification', 'N/A')}"
+        )
+        logger.info(
+            "Reusing analysis of a near-duplicate for lead: %s (from %s)",
+            lead.title, lead.source,
+        )
+        return llm_data
 
-            response_content = response.text
-            if not response_content:
-                # Check for safety ratings or other reasons for an empty response
-                try:
-                    # Accessing parts can raise an exception if the list is empty
-                    if not response.parts:
-                        logger.error(f"Gemini response was empty for '{lead.title}'. Finish reason: {response.prompt_feedback}")
-                    else:
-                        logger.error(f"Gemini response was empty for '{lead.title}'. Candidates: {response.candidates}")
-                except (ValueError, IndexError):
-                     logger.error(f"Gemini response was empty and content could not be inspected for '{lead.title}'.")
-                return None
-
-            llm_data = json.loads(response_content)
-
-            # Basic validation of the parsed data
-            required_keys = ["score", "justification", "cover_letter_draft"]
-            if not all(key in llm_data for key in required_keys):
-                logger.error(f"LLM response missing required keys: {response_content}")
-                return None
-
-            # Assemble the final result dictionary
-            analyzed_job = {
-                "id": lead.id,
-                "title": lead.title,
-                "url": lead.url,
-                "source": lead.source,
-                "score": llm_data.get("score", 0),
-                "justification": llm_data.get("justification", "N/A"),
-                "cover_letter": llm_data.get("cover_letter_draft", ""),
-                "company_name": llm_data.get("extracted_company_name"),
-                "contact_info": llm_data.get("extracted_contact_info"),
-            }
-            logger.info(f"Successfully analyzed and qualified job: '{lead.title}'")
-            return analyzed_job
-
-        except google_exceptions.GoogleAPICallError as e:
-            logger.error(f"Google API error while analyzing '{lead.title}': {e}", exc_info=True)
+    def _parse_response(
+        self, lead: JobLead, response: Any, response_content: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validates a Gemini response and extracts the LLM's JSON payload.
+
+        Args:
+            lead (JobLead): The lead the response belongs to.
+            response (Any): The fully consumed `GenerateContentResponse`, used
+                            to explain empty responses.
+            response_content (str): The response text accumulated from the stream.
+
+        Returns:
+            Optional[Dict[str, Any]]: The parsed LLM data, or None if the
+                                      response is empty or malformed.
+        """
+        if not response_content:
+            # Check for safety ratings or other reasons for an empty response
+            try:
+                # Accessing parts can raise an exception if the list is empty
+                if not response.parts:
+                    logger.error(
+                        "Gemini response was empty for '%s'. Finish reason: %s",
+                        lead.title, response.prompt_feedback,
+                    )
+                else:
+                    logger.error(
+                        "Gemini response was empty for '%s'. Candidates: %s",
+                        lead.title, response.candidates,
+                    )
+            except (ValueError, IndexError):
+                logger.error(
+                    "Gemini response was empty and content could not be inspected for '%s'.",
+                    lead.title,
+                )
             return None
+
+        try:
+            llm_data = _json_loads(response_content)
         except json.JSONDecodeError as e:
             logger.error(
-                f"Failed to parse JSON response from LLM for '{lead.title}': {e}\n"
-                f"Raw response: {response_content}",
+                "Failed to parse JSON response from LLM for '%s': %s\nRaw response: %s",
+                lead.title, e, response_content,
                 exc_info=True
             )
             return None
-        except Exception as e:
+
+        # Basic validation of the parsed data
+        if not isinstance(llm_data, dict):
+            logger.error("LLM response is not a JSON object: %s", response_content)
+            return None
+        if not _REQUIRED_KEYS.issubset(llm_data):
             logger.error(
-                f"An unexpected error occurred during qualification of '{lead.title}': {e}",
+                "LLM response missing required keys %s: %s",
+                sorted(_REQUIRED_KEYS - llm_data.keys()), response_content,
+            )
+            return None
+
+        return llm_data
+
+    def _build_result(self, lead: JobLead, llm_data: Dict[str, Any]) -> AnalyzedJob:
+        """
+        Assembles the analyzed job from a lead and its LLM data.
+
+        Args:
+            lead (JobLead): The analyzed lead.
+            llm_data (Dict[str, Any]): The validated JSON payload from the LLM.
+
+        Returns:
+            AnalyzedJob: The analyzed job.
+        """
+        return AnalyzedJob(
+            id=lead.id,
+            title=lead.title,
+            url=lead.url,
+            source=lead.source,
+            score=_as_score(llm_data.get("score", 0)),
+            justification=llm_data.get("justification", "N/A"),
+            cover_letter=llm_data.get("cover_letter_draft", ""),
+            company_name=llm_data.get("extracted_company_name"),
+            contact_info=llm_data.get("extracted_contact_info"),
+        )
+
+    def _finish(
+        self,
+        cache_key: str,
+        lead: JobLead,
+        llm_data: Optional[Dict[str, Any]],
+        embedding: Optional[List[float]],
+        context: str,
+    ) -> Optional[AnalyzedJob]:
+        """
+        Caches a fresh LLM result and assembles the analyzed job.
+
+        Args:
+            cache_key (str): The cache key of the lead's prompt.
+            lead (JobLead): The analyzed lead.
+            llm_data (Optional[Dict[str, Any]]): The parsed LLM data, if any.
+            embedding (Optional[List[float]]): The lead's embedding, if any.
+            context (str): The semantic-cache context key of the scan.
+
+        Returns:
+            Optional[AnalyzedJob]: The analyzed job, or None if there was no
+                                   valid LLM data.
+        """
+        if llm_data is None:
+            return None
+
+        self._cache.set(cache_key, llm_data, expire=config.ANALYSIS_CACHE_TTL_SECONDS)
+        if embedding is not None:
+            reusable = {key: llm_data[key] for key in _SEMANTIC_REUSE_KEYS if key in llm_data}
+            self._semantic_cache.add(embedding, context, reusable)
+        logger.info("Successfully analyzed and qualified job: '%s'", lead.title)
+        return self._build_result(lead, llm_data)
+
+    def _log_analysis_error(self, lead: JobLead, error: Exception) -> None:
+        """
+        Logs an exception raised while analyzing a lead.
+
+        Args:
+            lead (JobLead): The lead that was being analyzed.
+            error (Exception): The exception that was raised.
+        """
+        if isinstance(error, self._gexc.GoogleAPICallError):
+            logger.error(
+                "Google API error while analyzing '%s': %s", lead.title, error, exc_info=True
+            )
+        else:
+            logger.error(
+                "An unexpected error occurred during qualification of '%s': %s",
+                lead.title, error,
                 exc_info=True,
             )
-            return None
\ No newline at end of file
+
+    async def _query_model_async(
+        self,
+        pending: _PendingLead,
+        context: str,
+        embedding: Optional[List[float]],
+    ) -> Optional[AnalyzedJob]:
+        """
+        Analyzes a lead that missed the result cache.
+
+        The semantic cache is consulted first; otherwise the prepared prompt
+        is sent to the model. Either way, the result is stored in the result
+        cache under the lead's own key, so the next scan finds it there.
+
+        Args:
+            pending (_PendingLead): The lead with its prompt and cache key.
+            context (str): The semantic-cache context key of the scan.
+            embedding (Optional[List[float]]): The lead's embedding, if any.
+
+        Returns:
+            Optional[AnalyzedJob]: The analyzed job, or None if analysis fails.
+        """
+        lead = pending.lead
+        similar = self._get_similar(embedding, context, lead)
+        if similar is not None:
+            self._cache.set(pending.cache_key, similar, expire=config.ANALYSIS_CACHE_TTL_SECONDS)
+            return self._build_result(lead, similar)
+
+        logger.info("Analyzing lead: %s (from %s)", lead.title, lead.source)
+
+        try:
+            # Stream the response, yielding to other leads while tokens arrive.
+            response = await self.model.generate_content_async(
+                pending.prompt,
+                generation_config=self._gen_config,
+                stream=True,
+                request_options=self._request_options,
+            )
+            chunks: List[str] = []
+            async for chunk in response:
+                chunks.append(_chunk_text(chunk))
+            llm_data = self._parse_response(lead, response, "".join(chunks))
+        except Exception as e:
+            self._log_analysis_error(lead, e)
+            return None
+
+        return self._finish(pending.cache_key, lead, llm_data, embedding, context)
+
+    async def _analyze_bounded(
+        self,
+        pending: _PendingLead,
+        context: str,
+        semaphore: asyncio.Semaphore,
+        embeddings: Mapping[JobLead, List[float]],
+    ) -> Tuple[JobLead, Optional[AnalyzedJob]]:
+        """
+        Analyzes one lead from `_split_cached` once a slot in `semaphore` is free.
+
+        Args:
+            pending (_PendingLead): The lead with its prompt and cache key.
+            context (str): The semantic-cache context key of the scan.
+            semaphore (asyncio.Semaphore): Caps the number of requests in flight.
+            embeddings (Mapping[JobLead, List[float]]): Prefetched embeddings.
+
+        Returns:
+            Tuple[JobLead, Optional[AnalyzedJob]]: The lead and its result.
+        """
+        lead = pending.lead
+        try:
+            async with semaphore:
+                return lead, await self._query_model_async(
+                    pending, context, embeddings.get(lead)
+                )
+        except Exception as e:
+            logger.error("Analysis task for '%s' failed: %s", lead.title, e)
+            return lead, None
+
+    async def iter_analyzed(
+        self,
+        leads: List[JobLead],
+        resume_section: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> AsyncIterator[Tuple[JobLead, Optional[AnalyzedJob]]]:
+        """
+        Analyzes many leads concurrently, yielding each one as soon as it is done.
+
+        Leads answered by the result cache, or skipped by the pre-filter, are
+        yielded first, without waiting for any request. The rest are embedded
+        in batches for the semantic cache, and then analyzed with at most
+        `config.MAX_CONCURRENT_ANALYSES` requests in flight at any time. If the
+        consumer stops iterating early (and the generator is closed), requests
+        that are still pending are cancelled.
+
+        Args:
+            leads (List[JobLead]): The leads to analyze.
+            resume_section (str): The resume section from `prepare_resume`.
+            semaphore (Optional[asyncio.Semaphore]): Caps the number of requests
+                in flight. Pass the same semaphore to concurrent calls to share
+                one limit between them. Defaults to a new semaphore of
+                `config.MAX_CONCURRENT_ANALYSES` slots.
+
+        Yields:
+            Tuple[JobLead, Optional[AnalyzedJob]]: Each lead with its analyzed
+                                                   job data, or None if it
+                                                   failed, was skipped, or
+                                                   was not qualified.
+        """
+        resolved, pending = self._split_cached(leads, resume_section)
+        for item in resolved:
+            yield item
+
+        embeddings = await self._prefetch_embeddings([item.lead for item in pending])
+        context = _semantic_context(self._keywords_str, resume_section)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_ANALYSES)
+        tasks = [
+            asyncio.ensure_future(self._analyze_bounded(item, context, semaphore, embeddings))
+            for item in pending
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def flush(self) -> None:
+        """Writes in-memory caches to disk. Call this at the end of a scan."""
+        self._semantic_cache.save()
+
+
+# The process-wide agent shared by all worker threads, created on first use.
+_AGENT: Optional[QualifierAgent] = None
+_AGENT_LOCK = threading.Lock()
+
+
+def get_qualifier_agent() -> QualifierAgent:
+    """
+    Returns the shared `QualifierAgent`, creating it on first use.
+
+    `genai.configure` sets process-global state and the Gemini client is safe to
+    share between threads, so a single agent (and a single configured client)
+    serves every worker and every scan.
+
+    Returns:
+        QualifierAgent: The shared agent instance.
+    """
+    global _AGENT
+    if _AGENT is None:
+        with _AGENT_LOCK:
+            if _AGENT is None:
+                _AGENT = QualifierAgent()
+    return _AGENT
@@ -5,7 +5,9 @@ job leads from configured subreddits.
 """
 
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 
 import praw
 import prawcore
@@ -28,7 +30,7 @@ class RedditScout(BaseScout):
     handling for the API interactions.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http_session: Optional[Any] = None) -> None:
         """
         Initializes the RedditScout.
 
@@ -36,16 +38,25 @@ class RedditScout(BaseScout):
         application's configuration. If the required credentials are not
         provided, the PRAW client will not be initialized, and an error will
         be logged.
+
+        Args:
+            http_session (Optional[Any]): A `requests.Session` for PRAW to send
+                                          its requests through, if any.
         """
-        super().__init__()
+        super().__init__(http_session)
         self.reddit: Optional[praw.Reddit] = None
+        # PRAW is not thread-safe, so every fetching thread gets its own client
+        # (see `_thread_client`), built with the same arguments as `self.reddit`.
+        self._reddit_kwargs: Dict[str, Any] = {}
+        self._thread_local = threading.local()
+        settings = config.get_settings()
 
         # Validate that all necessary Reddit credentials are provided in the config
         if not all(
             [
-                config.REDDIT_CLIENT_ID,
-                config.REDDIT_CLIENT_SECRET,
-                config.REDDIT_USER_AGENT,
+                settings.reddit_client_id,
+                settings.reddit_client_secret,
+                settings.reddit_user_agent,
             ]
         ):
             logger.critical(
@@ -54,14 +65,21 @@ class RedditScout(BaseScout):
             )
             return
 
+        requestor_kwargs: Dict[str, Any] = {}
+        if http_session is not None:
+            requestor_kwargs["session"] = http_session
+
+        self._reddit_kwargs = dict(
+            client_id=settings.reddit_client_id,
+            client_secret=settings.reddit_client_secret,
+            user_agent=settings.reddit_user_agent,
+            read_only=True,  # We only need to read posts
+            requestor_kwargs=requestor_kwargs,
+        )
+
         try:
             # Initialize the PRAW client
-            self.reddit = praw.Reddit(
-                client_id=config.REDDIT_CLIENT_ID,
-                client_secret=config.REDDIT_CLIENT_SECRET,
-                user_agent=config.REDDIT_USER_AGENT,
-                read_only=True,  # We only need to read posts
-            )
+            self.reddit = praw.Reddit(**self._reddit_kwargs)
             # The PRAW instance is lazy-loaded, so check if credentials are valid
             # by making a simple, authenticated request.
             self.reddit.user.me()  # This will raise an exception if auth fails
@@ -79,8 +97,9 @@ class RedditScout(BaseScout):
         """
         Searches configured subreddits for new posts and converts them to JobLead objects.
 
-        Iterates through the list of subreddits defined in `config.SUBREDDITS_TO_SCAN`,
-        fetching the latest posts from each. It ensures that duplicate posts
+        Fetches the latest posts from every subreddit defined in
+        `config.SUBREDDITS_TO_SCAN` concurrently, using up to
+        `config.MAX_WORKER_THREADS` threads. It ensures that duplicate posts
         (e.g., cross-posts) are not included in the final list.
 
         Returns:
@@ -95,45 +114,99 @@ class RedditScout(BaseScout):
             )
             return []
 
-        leads: List[JobLead] = []
-        seen_post_ids = set()
         subreddits = config.SUBREDDITS_TO_SCAN
         limit = config.REDDIT_POST_LIMIT
+        if not subreddits:
+            return []
 
         logger.info(
             f"Starting Reddit scan across {len(subreddits)} subreddits "
             f"(limit: {limit} posts per subreddit)."
         )
 
-        for subreddit_name in subreddits:
-            try:
-                logger.debug(f"Scanning subreddit: r/{subreddit_name}")
-                subreddit = self.reddit.subreddit(subreddit_name)
-                # Fetch the newest submissions from the subreddit
-                for submission in subreddit.new(limit=limit):
-                    if submission.id not in seen_post_ids:
-                        # Convert the PRAW Submission to our standard JobLead format
-                        lead = JobLead(
-                            id=submission.id,
-                            title=submission.title,
-                            body=submission.selftext,
-                            url=f"https://www.reddit.com{submission.permalink}",
-                            source=f"Reddit (r/{subreddit_name})",
-                        )
+        # Each subreddit is a separate blocking HTTPS request, so they are
+        # fetched in parallel, each thread with its own PRAW client. Results are merged in configuration order, so a
+        # cross-post is always attributed to the same subreddit.
+        max_workers = min(config.MAX_WORKER_THREADS, len(subreddits))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="reddit") as executor:
+            futures = [
+                executor.submit(self._fetch_subreddit, subreddit_name, limit)
+                for subreddit_name in subreddits
+            ]
+
+            leads: List[JobLead] = []
+            seen_post_ids = set()
+            for future in futures:
+                for lead in future.result():
+                    if lead.id not in seen_post_ids:
                         leads.append(lead)
-                        seen_post_ids.add(submission.id)
+                        seen_post_ids.add(lead.id)
 
-            except prawcore.exceptions.Redirect:
-                logger.warning(f"Subreddit r/{subreddit_name} not found or is private.")
-            except prawcore.exceptions.PrawcoreException as e:
-                logger.error(
-                    f"An API error occurred while scanning r/{subreddit_name}: {e}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"An unexpected error occurred while processing r/{subreddit_name}: {e}",
-                    exc_info=True,
+        logger.info(f"Reddit scan complete. Found {len(leads)} unique potential leads.")
+        return leads
+
+    def _thread_client(self) -> praw.Reddit:
+        """
+        Returns the calling thread's PRAW client, creating it on first use.
+
+        A `praw.Reddit` instance must not be shared between threads, as its
+        rate limiter, token refresh and session state are not synchronized.
+
+        Returns:
+            praw.Reddit: A client configured like `self.reddit`.
+        """
+        reddit = getattr(self._thread_local, "reddit", None)
+        if reddit is None:
+            reddit = praw.Reddit(**self._reddit_kwargs)
+            self._thread_local.reddit = reddit
+        return reddit
+
+    def _fetch_subreddit(self, subreddit_name: str, limit: int) -> List[JobLead]:
+        """
+        Fetches the newest posts of one subreddit as JobLead objects.
+
+        Errors are logged and result in an empty list, so one failing
+        subreddit doesn't abort the whole scan.
+
+        Args:
+            subreddit_name (str): The name of the subreddit, without "r/".
+            limit (int): The maximum number of posts to fetch.
+
+        Returns:
+            List[JobLead]: The subreddit's posts that have body text.
+        """
+        leads: List[JobLead] = []
+        try:
+            logger.debug("Scanning subreddit: r/%s", subreddit_name)
+            subreddit = self._thread_client().subreddit(subreddit_name)
+            # Fetch the newest submissions from the subreddit
+            for submission in subreddit.new(limit=limit):
+                # Posts without body text can't be qualified, so drop them here.
+                # Link posts never have one, and `is_self` settles that without
+                # looking at the text.
+                if not submission.is_self:
+                    continue
+                if not submission.selftext or not submission.selftext.strip():
+                    continue
+                # Convert the PRAW Submission to our standard JobLead format
+                leads.append(
+                    JobLead(
+                        id=submission.id,
+                        title=submission.title,
+                        body=submission.selftext,
+                        url=f"https://www.reddit.com{submission.permalink}",
+                        source=f"Reddit (r/{subreddit_name})",
+                    )
                 )
 
-        logger.info(f"Reddit scan complete. Found {len(leads)} unique potential leads.")
-        return leads
\ No newline at end of file
+        except prawcore.exceptions.Redirect:
+            logger.warning("Subreddit r/%s not found or is private.", subreddit_name)
+        except prawcore.exceptions.PrawcoreException as e:
+            logger.error("An API error occurred while scanning r/%s: %s", subreddit_name, e)
+        except Exception as e:
+            logger.error(
+                "An unexpected error occurred while processing r/%s: %s",
+                subreddit_name, e,
+                exc_info=True,
+            )
+        return leads
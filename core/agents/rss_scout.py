@@ -4,8 +4,12 @@ To implement an RSS scout plugin, using the feedparser library to find
 potential job leads from configured RSS feeds.
 """
 
+import json
 import logging
-from typing import List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import feedparser
@@ -15,6 +19,10 @@ import config
 
 logger = logging.getLogger(__name__)
 
+# Stores each feed's ETag/Last-Modified validators and its leads from the last
+# full download, so unchanged feeds can be answered from a 304 response.
+_FEED_STATE_PATH = os.path.join(config.CACHE_DIR, "rss_feeds.json")
+
 
 class RSSScout(BaseScout):
     """
@@ -24,17 +32,51 @@ class RSSScout(BaseScout):
     RSS feeds, parse their content, and collect them as potential job leads.
     """
 
-    def __init__(self) -> None:
-        """Initializes the RSSScout."""
-        super().__init__()
+    def __init__(self, http_session: Optional[Any] = None) -> None:
+        """
+        Initializes the RSSScout.
+
+        Args:
+            http_session (Optional[Any]): Unused; feedparser does its own
+                fetching, and feeds are revalidated with conditional GETs.
+        """
+        super().__init__(http_session)
         # No special client initialization needed for feedparser
+        self._feed_state: Dict[str, Dict[str, Any]] = self._load_feed_state()
+
+    @staticmethod
+    def _load_feed_state() -> Dict[str, Dict[str, Any]]:
+        """Loads the saved per-feed validators and leads, if any."""
+        try:
+            with open(_FEED_STATE_PATH, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read RSS feed state. Feeds will be fully re-fetched. Error: {e}")
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _save_feed_state(self) -> None:
+        """Writes the per-feed validators and leads to disk."""
+        tmp_path = f"{_FEED_STATE_PATH}.tmp"
+        try:
+            os.makedirs(os.path.dirname(_FEED_STATE_PATH), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._feed_state, f)
+            os.replace(tmp_path, _FEED_STATE_PATH)
+        except OSError as e:
+            logger.error(f"Failed to save RSS feed state: {e}")
 
     def find_leads(self) -> List[JobLead]:
         """
         Parses configured RSS feeds for new posts (leads).
 
-        Iterates through the list of feed URLs defined in `config.RSS_FEEDS_TO_SCAN`,
-        fetching and parsing the content of each.
+        Fetches and parses every feed defined in `config.RSS_FEEDS_TO_SCAN`
+        concurrently, using up to `config.MAX_WORKER_THREADS` threads. Feeds
+        are requested conditionally (ETag/Last-Modified), and a feed that has
+        not changed since the last scan yields its previously seen leads
+        without being downloaded again.
 
         Returns:
             List[JobLead]: A list of `JobLead` objects, each representing a
@@ -46,50 +88,108 @@ class RSSScout(BaseScout):
             logger.info("No RSS feeds configured to scan.")
             return []
 
-        leads: List[JobLead] = []
-        seen_lead_urls = set()
-
         logger.info(f"Starting RSS scan across {len(feeds)} feeds.")
 
-        for feed_url in feeds:
-            try:
-                logger.debug(f"Parsing feed: {feed_url}")
-                parsed_feed = feedparser.parse(feed_url)
+        # Fetching a feed is a blocking HTTP request, so feeds are fetched and
+        # parsed in parallel. Results are merged in configuration order.
+        max_workers = min(config.MAX_WORKER_THREADS, len(feeds))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss") as executor:
+            futures = [executor.submit(self._fetch_feed, feed_url) for feed_url in feeds]
 
-                # feedparser sets a 'bozo' flag if the feed is malformed.
-                if parsed_feed.bozo:
-                    logger.warning(
-                        f"Feed at {feed_url} may be malformed. "
-                        f"Error: {parsed_feed.bozo_exception}"
-                    )
-                    # We can still try to process it, as some data might be valid.
-
-                source_name = urlparse(feed_url).hostname or feed_url
-
-                for entry in parsed_feed.entries:
+            leads: List[JobLead] = []
+            seen_lead_urls = set()
+            for future in futures:
+                for lead in future.result():
                     # Use link as a unique identifier
-                    if entry.link not in seen_lead_urls:
-                        # RSS feeds can have content in 'summary' or 'content' fields
-                        body = entry.get("summary", "")
-                        if not body and entry.get("content"):
-                             # The content can be a list of dictionaries
-                             body = entry.content[0].get("value", "")
-
-                        lead = JobLead(
-                            id=entry.get("id", entry.link),
-                            title=entry.title,
-                            body=body,
-                            url=entry.link,
-                            source=source_name,
-                        )
+                    if lead.url not in seen_lead_urls:
                         leads.append(lead)
-                        seen_lead_urls.add(entry.link)
+                        seen_lead_urls.add(lead.url)
 
-            except Exception as e:
-                logger.error(
-                    f"An unexpected error occurred while processing feed {feed_url}: {e}",
-                    exc_info=True,
-                )
+        self._save_feed_state()
 
         logger.info(f"RSS scan complete. Found {len(leads)} unique potential leads.")
-        return leads
\ No newline at end of file
+        return leads
+
+    def _fetch_feed(self, feed_url: str) -> List[JobLead]:
+        """
+        Fetches and parses one feed into JobLead objects.
+
+        The saved validators are sent with the request. On a 304 (Not Modified)
+        response, the leads from the last full download are returned; after a
+        full download, the feed's new validators and leads are recorded.
+
+        Errors are logged and result in an empty list, so one failing feed
+        doesn't abort the whole scan.
+
+        Args:
+            feed_url (str): The URL of the RSS feed.
+
+        Returns:
+            List[JobLead]: The feed's entries that have body text.
+        """
+        leads: List[JobLead] = []
+        try:
+            logger.debug("Parsing feed: %s", feed_url)
+            previous = self._feed_state.get(feed_url, {})
+            parsed_feed = feedparser.parse(
+                feed_url,
+                etag=previous.get("etag"),
+                modified=previous.get("modified"),
+            )
+
+            if parsed_feed.get("status") == 304:
+                logger.debug("Feed not modified since last scan: %s", feed_url)
+                return [JobLead(**fields) for fields in previous.get("leads", [])]
+
+            # feedparser sets a 'bozo' flag if the feed is malformed.
+            if parsed_feed.bozo:
+                logger.warning(
+                    "Feed at %s may be malformed. Error: %s",
+                    feed_url, parsed_feed.bozo_exception,
+                )
+                # We can still try to process it, as some data might be valid.
+
+            source_name = urlparse(feed_url).hostname or feed_url
+
+            for entry in parsed_feed.entries:
+                # RSS feeds can have content in 'summary' or 'content' fields
+                body = entry.get("summary", "")
+                if not body and entry.get("content"):
+                    # The content can be a list of dictionaries
+                    body = entry.content[0].get("value", "")
+
+                # Entries without body text can't be qualified, so drop them here.
+                if not body or not body.strip():
+                    continue
+
+                leads.append(
+                    JobLead(
+                        id=entry.get("id", entry.link),
+                        title=entry.title,
+                        body=body,
+                        url=entry.link,
+                        source=source_name,
+                    )
+                )
+
+            # Without an HTTP status the request itself failed; keep the old state.
+            if "status" in parsed_feed:
+                etag = parsed_feed.get("etag")
+                modified = parsed_feed.get("modified")
+                if etag or modified:
+                    # Each thread writes only its own feed's key.
+                    self._feed_state[feed_url] = {
+                        "etag": etag,
+                        "modified": modified,
+                        "leads": [asdict(lead) for lead in leads],
+                    }
+                else:
+                    self._feed_state.pop(feed_url, None)
+
+        except Exception as e:
+            logger.error(
+                "An unexpected error occurred while processing feed %s: %s",
+                feed_url, e,
+                exc_info=True,
+            )
+        return leads
@@ -0,0 +1,137 @@
+# core/cache.py
+"""
+To provide a small, persistent key/value cache for expensive results, such as
+LLM analyses, so they survive across scans and application restarts.
+
+This module provides the `ResultCache` class, a thin wrapper around a single
+SQLite file. It needs only the standard library (orjson speeds up entry
+(de)serialization when installed) and is safe to use from multiple threads,
+as every operation opens its own connection.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+# Optional dependencies
+try:
+    import orjson
+
+    def _dumps(value: Any) -> str:
+        """Serializes a value to a JSON string with orjson."""
+        return orjson.dumps(value).decode("utf-8")
+
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+
+class ResultCache:
+    """
+    A SQLite-backed cache mapping string keys to JSON-serializable dictionaries.
+
+    Entries can be given an expiry time. Expired entries are treated as misses
+    and are deleted the next time the cache is opened. Any database error is logged and
+    treated as a cache miss, so a broken cache never stops the application
+    from working.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes the cache, creating its database file if needed and
+        deleting expired entries.
+
+        Args:
+            path (str): The path to the SQLite database file.
+        """
+        self.path = path
+        self._enabled = True
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with closing(self._connect()) as conn:
+                # WAL lets concurrent readers proceed while an entry is written.
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+                )
+                # Keys are content hashes, so an expired entry would rarely be
+                # overwritten; without this the file only ever grows.
+                pruned = conn.execute(
+                    "DELETE FROM cache WHERE expires_at < ?", (time.time(),)
+                ).rowcount
+            logger.info(f"Result cache ready at: {path} ({pruned} expired entries pruned)")
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Could not open result cache at {path}. Caching disabled. Error: {e}")
+            self._enabled = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens a new autocommit connection to the cache database."""
+        return sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached dictionary, or None on a miss
+                                      or if the entry has expired.
+        """
+        if not self._enabled:
+            return None
+
+        try:
+            with closing(self._connect()) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Result cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return None
+
+        try:
+            return _loads(value)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Discarding unreadable cache entry '{key}': {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any], expire: Optional[float] = None) -> None:
+        """
+        Stores a value in the cache.
+
+        Args:
+            key (str): The cache key.
+            value (Dict[str, Any]): A JSON-serializable dictionary to store.
+            expire (Optional[float]): The entry's lifetime in seconds, or None
+                                      for an entry that never expires.
+        """
+        if not self._enabled:
+            return
+
+        expires_at = time.time() + expire if expire is not None else None
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, _dumps(value), expires_at),
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.error(f"Failed to store result cache entry '{key}': {e}")
@@ -0,0 +1,241 @@
+# core/semantic_cache.py
+"""
+To provide a similarity-based cache that recognizes near-duplicate job posts,
+so a reworded repost can reuse an earlier LLM analysis.
+
+This module provides the `SemanticCache` class, which stores embedding vectors
+alongside cached values and answers lookups by cosine similarity. It requires
+`numpy`; if numpy is not installed, the cache is disabled and every lookup is
+a miss.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    An in-memory, disk-persisted cache keyed by embedding similarity.
+
+    Each entry is an L2-normalized embedding vector, a context key and a
+    JSON-serializable value. A lookup returns the value of the most similar
+    entry with the same context key if its cosine similarity reaches the
+    configured threshold. The context key scopes entries to the inputs that
+    shaped them (for example, the resume and keywords used for an analysis).
+
+    Vectors are stored with `numpy.save` in `<path>.npy` and the values in
+    `<path>.json`. Call `save()` to persist changes.
+    """
+
+    def __init__(self, path: str, threshold: float, max_entries: int) -> None:
+        """
+        Initializes the cache, loading any previously saved entries.
+
+        Args:
+            path (str): The base path of the cache files, without extension.
+            threshold (float): The minimum cosine similarity for a hit (0-1).
+            max_entries (int): The maximum number of entries kept; the oldest
+                               entries are dropped first.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._vectors_path = f"{path}.npy"
+        self._values_path = f"{path}.json"
+        self._lock = threading.Lock()
+        # Entries live in preallocated arrays that grow by doubling up to
+        # `max_entries`. Once full, they form a ring: a new entry overwrites
+        # the oldest one, at `_oldest`, so nothing is copied per insert.
+        self._vectors: Any = None
+        self._context_ids: Any = None
+        self._values: List[Optional[Dict[str, Any]]] = []
+        self._size = 0
+        self._oldest = 0
+        # Context keys are stored once and referred to by index, so a lookup
+        # compares small integers rather than strings.
+        self._context_names: List[str] = []
+        self._context_index: Dict[str, int] = {}
+        self._dirty = False
+        self._enabled = np is not None
+
+        if not self._enabled:
+            logger.warning("numpy is not installed. The semantic cache is disabled.")
+            return
+
+        self._load()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether numpy is available and the cache is in use."""
+        return self._enabled
+
+    def _load(self) -> None:
+        """Loads the saved vectors and values, if present and consistent."""
+        if not (os.path.exists(self._vectors_path) and os.path.exists(self._values_path)):
+            return
+
+        try:
+            vectors = np.load(self._vectors_path)
+            with open(self._values_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load the semantic cache. Starting empty. Error: {e}")
+            return
+
+        if len(entries) != len(vectors) or vectors.ndim != 2:
+            logger.warning("Semantic cache files are out of sync. Starting empty.")
+            return
+
+        # Keep the newest entries if the limit was lowered since the save.
+        vectors = vectors[-self.max_entries:]
+        entries = entries[-self.max_entries:]
+        self._reset(vectors.shape[1], capacity=len(entries))
+        self._vectors[:len(entries)] = vectors
+        for slot, entry in enumerate(entries):
+            self._context_ids[slot] = self._context_id(entry["context"])
+            self._values[slot] = entry["value"]
+        self._size = len(entries)
+        logger.info(f"Loaded {self._size} semantic cache entries.")
+
+    def _reset(self, dimensions: int, capacity: int = 64) -> None:
+        """Empties the cache and allocates room for `capacity` vectors."""
+        capacity = max(1, min(self.max_entries, capacity))
+        self._vectors = np.empty((capacity, dimensions), dtype=np.float32)
+        self._context_ids = np.empty(capacity, dtype=np.int32)
+        self._values = [None] * capacity
+        self._size = 0
+        self._oldest = 0
+        self._context_names = []
+        self._context_index = {}
+
+    def _grow(self) -> None:
+        """Doubles the allocated room, up to `max_entries`."""
+        capacity = min(self.max_entries, 2 * len(self._vectors))
+        vectors = np.empty((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        context_ids = np.empty(capacity, dtype=np.int32)
+        context_ids[:self._size] = self._context_ids[:self._size]
+        self._vectors = vectors
+        self._context_ids = context_ids
+        self._values.extend([None] * (capacity - len(self._values)))
+
+    def _context_id(self, context: str) -> int:
+        """Returns the index of a context key, registering it if it is new."""
+        context_id = self._context_index.get(context)
+        if context_id is None:
+            context_id = len(self._context_names)
+            self._context_names.append(context)
+            self._context_index[context] = context_id
+        return context_id
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> Any:
+        """Returns `vector` as an L2-normalized float32 array, or None if zero."""
+        array = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(array))
+        if norm == 0.0:
+            return None
+        return array / norm
+
+    def lookup(self, vector: Sequence[float], context: str) -> Optional[Dict[str, Any]]:
+        """
+        Finds the value of the most similar entry sharing the same context.
+
+        Args:
+            vector (Sequence[float]): The embedding to look up.
+            context (str): The context key the entry must have been stored with.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached value, or None on a miss.
+        """
+        if not self._enabled:
+            return None
+
+        query = self._normalize(vector)
+        if query is None:
+            return None
+
+        with self._lock:
+            if not self._size or self._vectors.shape[1] != query.shape[0]:
+                return None
+            context_id = self._context_index.get(context)
+            if context_id is None:
+                return None
+
+            # Vectors are stored normalized, so the dot product is the cosine.
+            scores = self._vectors[:self._size] @ query
+            scores[self._context_ids[:self._size] != context_id] = -1.0
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+            return self._values[best]
+
+    def add(self, vector: Sequence[float], context: str, value: Dict[str, Any]) -> None:
+        """
+        Adds an entry to the cache.
+
+        Args:
+            vector (Sequence[float]): The embedding of the cached item.
+            context (str): The context key to store the entry under.
+            value (Dict[str, Any]): A JSON-serializable value to cache.
+        """
+        if not self._enabled:
+            return
+
+        row = self._normalize(vector)
+        if row is None:
+            return
+
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != row.shape[0]:
+                # First entry, or the embedding model changed: start over.
+                self._reset(row.shape[0])
+
+            if self._size < self.max_entries:
+                if self._size == len(self._vectors):
+                    self._grow()
+                slot = self._size
+                self._size += 1
+            else:
+                slot = self._oldest
+                self._oldest = (self._oldest + 1) % self.max_entries
+
+            self._vectors[slot] = row
+            self._context_ids[slot] = self._context_id(context)
+            self._values[slot] = value
+            self._dirty = True
+
+    def save(self) -> None:
+        """Writes the cache to disk if it changed since it was loaded or saved."""
+        if not self._enabled:
+            return
+
+        with self._lock:
+            if not self._dirty or not self._size:
+                return
+            # Oldest first, so a reload (and its trimming) keeps the order.
+            order = [*range(self._oldest, self._size), *range(self._oldest)]
+            entries = [
+                {
+                    "context": self._context_names[self._context_ids[slot]],
+                    "value": self._values[slot],
+                }
+                for slot in order
+            ]
+            try:
+                os.makedirs(os.path.dirname(self._vectors_path) or ".", exist_ok=True)
+                np.save(self._vectors_path, self._vectors[order])
+                with open(self._values_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f)
+                self._dirty = False
+            except (OSError, TypeError, ValueError) as e:
+                logger.error(f"Failed to save the semantic cache: {e}")
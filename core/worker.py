@@ -4,21 +4,60 @@ To define the QObject worker that runs in a background QThread, handling all
 scraping and AI analysis to keep the GUI responsive.
 """
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Dict, Optional, List, Type
+import os
+import time
+from typing import Any, Dict, Optional, List, Set, Tuple, Type
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import importlib
 
 from PySide6.QtCore import QObject, Signal, Slot
 
+# Optional dependencies
+try:
+    import requests_cache
+except ImportError:
+    # Scouts then use their clients' own, uncached sessions.
+    requests_cache = None
+
 import config
-from core.agents.base_scout import BaseScout, JobLead
-from core.agents.qualifier_agent import QualifierAgent
+from core.agents.base_scout import BaseScout
+from core.agents.qualifier_agent import (
+    AnalyzedJob,
+    QualifierAgent,
+    get_qualifier_agent,
+    get_resume_content,
+)
 
 logger = logging.getLogger(__name__)
 
+# How often, in seconds, the stop flag is checked while waiting on the scouts.
+_STOP_POLL_SECONDS = 0.25
+
+# Query parameters that only track where a visitor came from. They are ignored
+# when comparing lead URLs; any other parameter may identify the posting.
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref"})
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+
+# The minimum time, in seconds, between two updates (status, progress, found
+# jobs) sent to the GUI while leads are analyzed.
+_UI_UPDATE_INTERVAL_SECONDS = 0.25
 
+# The resume file types that can be read.
+_RESUME_EXTENSIONS = ('.pdf', '.txt', '.md')
+
+
+@functools.lru_cache(maxsize=None)
 def _import_class_from_string(path: str) -> Optional[Type[BaseScout]]:
-    """Dynamically imports a class from a string path."""
+    """
+    Dynamically imports a class from a string path.
+
+    Results are memoized, including None for a path that failed, so a broken
+    entry is reported once rather than on every lookup.
+    """
     try:
         module_name, class_name = path.rsplit('.', 1)
         module = importlib.import_module(module_name)
@@ -28,6 +67,39 @@ def _import_class_from_string(path: str) -> Optional[Type[BaseScout]]:
         return None
 
 
+def _url_key(url: str) -> str:
+    """
+    Normalizes a lead URL for duplicate detection.
+
+    The scheme and host are lower-cased, and the fragment, a trailing slash and
+    tracking parameters (see `_TRACKING_PARAMS`) are dropped. The path and the
+    remaining query are kept as they are, since boards such as
+    `viewjob?jk=...` identify postings by them.
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in _TRACKING_PARAMS
+        and not name.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ]
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip("/"),
+        urlencode(query),
+        "",
+    ))
+
+
+# The scout classes listed in `config.SCOUTS_TO_USE`, resolved once at import.
+_SCOUT_CLASSES: List[Type[BaseScout]] = [
+    scout_class
+    for scout_class in map(_import_class_from_string, config.SCOUTS_TO_USE)
+    if scout_class is not None
+]
+
+
 class Worker(QObject):
     """
     Handles long-running tasks in a separate thread.
@@ -38,14 +110,17 @@ class Worker(QObject):
     blocking the user interface.
 
     Attributes:
-        job_found (Signal): Emits a dictionary with analyzed job data.
+        jobs_found_batch (Signal): Emits lists of `AnalyzedJob` objects. Jobs
+                                   are collected for at most
+                                   `_UI_UPDATE_INTERVAL_SECONDS`, so the GUI
+                                   is woken once per batch rather than per job.
         progress_updated (Signal): Emits an integer percentage (0-100) of task completion.
         status_updated (Signal): Emits a string with the current status message.
         finished (Signal): Emitted when the entire task is complete.
         error_occurred (Signal): Emits an error message string if an exception occurs.
     """
 
-    job_found = Signal(dict)
+    jobs_found_batch = Signal(list)
     progress_updated = Signal(int)
     status_updated = Signal(str)
     finished = Signal()
@@ -62,6 +137,251 @@ class Worker(QObject):
         self._is_running = False
         self._scouts: List[BaseScout] = []
         self._qualifier_agent: Optional[QualifierAgent] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop used for analysis, creating it on first use.
+
+        The loop belongs to the worker's thread and is reused across scans, as
+        the Gemini async client binds its connections to the loop it first ran on.
+
+        Returns:
+            asyncio.AbstractEventLoop: The worker's event loop.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop
+
+    async def _scout_and_analyze(
+        self,
+        scout: BaseScout,
+        resume_section: str,
+        semaphore: asyncio.Semaphore,
+        results: asyncio.Queue,
+        found_counts: Dict[BaseScout, int],
+        claimed_urls: Set[str],
+    ) -> None:
+        """
+        Fetches one scout's leads and analyzes them as soon as they arrive.
+
+        A lead whose URL was already returned in this scan, by this or another
+        scout, is dropped, so a posting listed on several sources (or in
+        several feeds) is analyzed once.
+
+        Every analyzed lead is put on `results`, followed by the scout itself
+        once it is done (also on error), so the consumer can tell when all
+        scouts have finished.
+
+        Args:
+            scout (BaseScout): The scout to query.
+            resume_section (str): The resume section from `prepare_resume`.
+            semaphore (asyncio.Semaphore): The request limit shared by all scouts.
+            results (asyncio.Queue): Receives `(lead, analyzed_job)` pairs,
+                                     then `scout`.
+            found_counts (Dict[BaseScout, int]): Receives the number of leads
+                                                 the scout found.
+            claimed_urls (Set[str]): The normalized URLs of all leads found so
+                                     far in this scan, shared by the scouts.
+        """
+        try:
+            found = await scout.find_leads_async()
+            leads = []
+            for lead in found:
+                key = _url_key(lead.url)
+                if key:
+                    if key in claimed_urls:
+                        continue
+                    claimed_urls.add(key)
+                leads.append(lead)
+            if len(leads) < len(found):
+                logger.info(
+                    "Deduplicated %d lead(s) from %s.",
+                    len(found) - len(leads), scout.__class__.__name__,
+                )
+            found_counts[scout] = len(leads)
+            self.status_updated.emit(f"{scout.__class__.__name__} found {len(leads)} leads.")
+
+            analyzed = self._qualifier_agent.iter_analyzed(leads, resume_section, semaphore)
+            # Closing the generator on exit cancels any requests still in flight.
+            async with contextlib.aclosing(analyzed):
+                async for item in analyzed:
+                    await results.put(item)
+        finally:
+            await results.put(scout)
+
+    async def _scan(
+        self,
+        resume_section: str,
+    ) -> Tuple[int, bool]:
+        """
+        Runs all scouts concurrently and analyzes their leads as they come in.
+
+        Each scout feeds its leads straight into analysis (see
+        `_scout_and_analyze`), so the first results arrive while slower scouts
+        are still searching. The results are reported here: qualified jobs are
+        collected and emitted via `jobs_found_batch`, together with status and
+        progress, at most every `_UI_UPDATE_INTERVAL_SECONDS`. As the total
+        number of leads is only known once every scout has finished searching,
+        progress is measured against the leads found so far and scaled by the
+        share of scouts that are done.
+
+        Args:
+            resume_section (str): The resume section from `prepare_resume`.
+
+        Returns:
+            Tuple[int, bool]: The number of leads found, and whether the scan
+                              was stopped before all of them were analyzed.
+        """
+        results: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_ANALYSES)
+        found_counts: Dict[BaseScout, int] = {}
+        claimed_urls: Set[str] = set()
+        producers = [
+            asyncio.ensure_future(
+                self._scout_and_analyze(
+                    scout, resume_section, semaphore, results, found_counts, claimed_urls
+                )
+            )
+            for scout in self._scouts
+        ]
+        done_scouts: Set[BaseScout] = set()
+        completed = 0
+        progress = 0
+        last_update = 0.0
+        pending_jobs: List[AnalyzedJob] = []
+
+        try:
+            while len(done_scouts) < len(producers):
+                if not self._is_running:
+                    return sum(found_counts.values()), True
+                try:
+                    item = await asyncio.wait_for(results.get(), timeout=_STOP_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    # Nothing new for a while: deliver the jobs collected so far.
+                    if pending_jobs:
+                        self.jobs_found_batch.emit(pending_jobs)
+                        pending_jobs = []
+                    continue
+                if isinstance(item, BaseScout):
+                    done_scouts.add(item)
+                    continue
+
+                lead, analyzed_job = item
+                completed += 1
+                total_leads = sum(found_counts.values())
+
+                if analyzed_job:
+                    logger.info(
+                        "Job '%s' qualified with score %s.", lead.title, analyzed_job.score
+                    )
+                    pending_jobs.append(analyzed_job)
+                else:
+                    logger.info("Job '%s' was not qualified or failed analysis.", lead.title)
+
+                # Every update is a queued call into the GUI thread, so they are
+                # sent at most every `_UI_UPDATE_INTERVAL_SECONDS`. The final
+                # status and 100% are emitted by `run_scan`.
+                now = time.monotonic()
+                if now - last_update >= _UI_UPDATE_INTERVAL_SECONDS:
+                    last_update = now
+                    if pending_jobs:
+                        self.jobs_found_batch.emit(pending_jobs)
+                        pending_jobs = []
+                    # Scouts that found leads have finished searching, too.
+                    searched = len(done_scouts.union(found_counts))
+                    estimate = (completed / total_leads) * (searched / len(producers))
+                    # The total grows as scouts finish; never let the bar go back.
+                    progress = max(progress, int(estimate * 100))
+                    self.status_updated.emit(
+                        f"Analyzed lead {completed}/{total_leads}: {lead.title[:50]}..."
+                    )
+                    self.progress_updated.emit(progress)
+                logger.debug("Analyzed lead %d/%d: %s", completed, total_leads, lead.title)
+
+            # Re-raise the first scout error, if any, now that all are done.
+            for producer in producers:
+                producer.result()
+        finally:
+            # Deliver the jobs still collected (also on stop).
+            if pending_jobs:
+                self.jobs_found_batch.emit(pending_jobs)
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+
+        return sum(found_counts.values()), False
+
+    def _read_resume(self, resume_path: str) -> str:
+        """
+        Reads the resume file, reporting problems without aborting the scan.
+
+        The file is read here, on the worker's thread, so the GUI doesn't block
+        on disk I/O or PDF parsing. `get_resume_content` keeps the text of an
+        unchanged file, so repeated scans don't re-read it.
+
+        Args:
+            resume_path (str): The path to the resume file (.pdf, .txt, .md).
+
+        Returns:
+            str: The content of the resume file, or an empty string if the path
+                 is invalid or the file cannot be read.
+        """
+        if not resume_path or not os.path.exists(resume_path):
+            logger.warning(f"Resume file not found at: {resume_path}")
+            self.error_occurred.emit("Resume file not found. Analysis will proceed without it.")
+            return ""
+
+        if not resume_path.lower().endswith(_RESUME_EXTENSIONS):
+            logger.warning(f"Unsupported resume file type: {resume_path}")
+            self.error_occurred.emit(
+                "Resume file type is not supported. Please use .pdf, .txt, or .md. "
+                "Analysis will proceed without it."
+            )
+            return ""
+
+        try:
+            logger.info(f"Reading resume from: {resume_path}")
+            return get_resume_content(resume_path)
+        except Exception as e:
+            logger.error(f"Error reading resume file {resume_path}: {e}", exc_info=True)
+            self.error_occurred.emit(
+                f"Resume file could not be read: {e}. Analysis will proceed without it."
+            )
+            return ""
+
+    def _create_http_session(self) -> Optional[Any]:
+        """
+        Creates the HTTP session shared by the scouts.
+
+        With `requests-cache` installed, this is a SQLite-backed cached session,
+        so a page fetched again within `config.HTTP_CACHE_EXPIRE_SECONDS`
+        (sooner if the server's Cache-Control says so) is served from disk.
+
+        Returns:
+            Optional[Any]: The cached session, or None if `requests-cache` is
+                           not installed.
+        """
+        if requests_cache is None:
+            return None
+        return requests_cache.CachedSession(
+            os.path.join(config.CACHE_DIR, "http"),
+            backend="sqlite",
+            expire_after=config.HTTP_CACHE_EXPIRE_SECONDS,
+            allowable_codes=(200,),
+            cache_control=True,
+            stale_if_error=True,
+        )
+
+    def _create_scouts(self) -> List[BaseScout]:
+        """
+        Instantiates the scouts listed in `config.SCOUTS_TO_USE`.
+
+        Returns:
+            List[BaseScout]: The scouts that could be imported and created.
+        """
+        http_session = self._create_http_session()
+        return [ScoutClass(http_session=http_session) for ScoutClass in _SCOUT_CLASSES]
 
     @Slot()
     def stop(self) -> None:
@@ -75,17 +395,17 @@ class Worker(QObject):
         self._is_running = False
 
     @Slot(str)
-    def run_scan(self, resume_content: str) -> None:
+    def run_scan(self, resume_path: str) -> None:
         """
         The main entry point for the worker's task, designed to be run in a QThread.
 
-        This method initializes the agents, scrapes for job leads from configured
-        sources, analyzes each lead with the AI qualifier, and emits signals
-        with the results.
+        This method reads the resume, initializes the agents, scrapes for job
+        leads from configured sources, analyzes each lead with the AI
+        qualifier, and emits signals with the results.
 
         Args:
-            resume_content (str): The text content of the user's resume, used by
-                                  the QualifierAgent for analysis.
+            resume_path (str): The path to the user's resume file, whose content
+                               is used by the QualifierAgent for analysis.
         """
         if self._is_running:
             logger.warning("Scan is already in progress. Ignoring new request.")
@@ -99,73 +419,42 @@ class Worker(QObject):
         self.progress_updated.emit(0)
 
         try:
-            # Step 1: Initialize Agents
-            self.status_updated.emit("Initializing agents...")
-            self._qualifier_agent = QualifierAgent()
-            self._scouts = []
-            for scout_path in config.SCOUTS_TO_USE:
-                ScoutClass = _import_class_from_string(scout_path)
-                if ScoutClass:
-                    self._scouts.append(ScoutClass())
-
-            if not self._scouts:
-                raise RuntimeError("No valid scouts were initialized. Check config.py and logs.")
+            resume_content = self._read_resume(resume_path)
 
-            logger.info(f"{len(self._scouts)} scout(s) and Qualifier agent initialized.")
-
-            # Step 2: Find Leads from all sources
-            self.status_updated.emit("Searching for job leads from all sources...")
-            all_leads: List[JobLead] = []
-            for scout in self._scouts:
-                if not self._is_running:
-                    raise InterruptedError("Scan cancelled during lead search.")
-                self.status_updated.emit(f"Asking {scout.__class__.__name__} for leads...")
-                all_leads.extend(scout.find_leads())
+            # Step 1: Initialize Agents. They are built on the first scan and
+            # reused afterwards, so API clients are authenticated only once.
+            if self._qualifier_agent is None or not self._scouts:
+                self.status_updated.emit("Initializing agents...")
+                self._qualifier_agent = get_qualifier_agent()
+                self._scouts = self._create_scouts()
 
-            if not self._is_running:
-                raise InterruptedError("Scan cancelled during lead search.")
+                if not self._scouts:
+                    raise RuntimeError("No valid scouts were initialized. Check config.py and logs.")
 
-            if not all_leads:
-                logger.info("No new leads found from any source.")
-                self.status_updated.emit("No new job leads found.")
-                self.progress_updated.emit(100)
-                self._is_running = False
-                self.finished.emit()
-                return
-
-            logger.info(f"Found {len(all_leads)} potential leads in total. Starting analysis.")
-            total_leads = len(all_leads)
-
-            # Step 3: Analyze Leads
-            for i, lead in enumerate(all_leads):
-                if not self._is_running:
-                    scan_cancelled = True
-                    logger.info("Worker process was stopped externally during analysis.")
-                    break
+                logger.info(f"{len(self._scouts)} scout(s) and Qualifier agent initialized.")
 
-                status_msg = f"Analyzing lead {i + 1}/{total_leads}: {lead.title[:50]}..."
-                self.status_updated.emit(status_msg)
-                logger.debug(status_msg)
+            # The resume is identical for every lead, so it is formatted once.
+            resume_section = self._qualifier_agent.prepare_resume(resume_content)
 
-                analyzed_job = self._qualifier_agent.analyze_and_qualify(
-                    lead, resume_content
+            # Step 2: Find Leads from all sources in parallel, and analyze each
+            # scout's leads as soon as that scout is done.
+            self.status_updated.emit("Searching for job leads from all sources...")
+            loop = self._get_event_loop()
+            try:
+                total_leads, scan_cancelled = loop.run_until_complete(
+                    self._scan(resume_section)
                 )
+            finally:
+                self._qualifier_agent.flush()
 
-                if analyzed_job:
-                    logger.info(
-                        f"Job '{lead.title}' qualified with score "
-                        f"{analyzed_job.get('score')}."
-                    )
-                    self.job_found.emit(analyzed_job)
-                else:
-                    logger.info(f"Job '{lead.title}' was not qualified or failed analysis.")
-
-                progress = int(((i + 1) / total_leads) * 100)
-                self.progress_updated.emit(progress)
+            if scan_cancelled:
+                logger.info("Worker process was stopped externally during the scan.")
+            elif not total_leads:
+                logger.info("No new leads found from any source.")
+                self.status_updated.emit("No new job leads found.")
+            else:
+                logger.info("Analyzed %d leads in total.", total_leads)
 
-        except InterruptedError as e:
-            scan_cancelled = True
-            logger.warning(str(e))
         except Exception as e:
             error_message = f"An error occurred during the scan: {e}"
             logger.error(error_message, exc_info=True)
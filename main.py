@@ -19,6 +19,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 try:
+    import config
     from PySide6.QtWidgets import QApplication
     from ui.main_window import MainWindow
     from ui.dark_theme import apply_dark_theme
@@ -44,6 +45,8 @@ def main() -> int:
     logger.info("Starting Project Prospector application...")
 
     try:
+        config.bootstrap()
+
         app = QApplication(sys.argv)
         logger.info("QApplication instance created.")
 
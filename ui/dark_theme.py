@@ -8,6 +8,7 @@ dark theme and a function to apply it to the QApplication instance.
 """
 
 import logging
+import re
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -215,6 +216,12 @@ QSplitter::handle:hover {
 }
 """
 
+# The stylesheet as handed to Qt: comments and runs of whitespace removed once,
+# at import, so Qt's QSS parser has less text to tokenize whenever it is parsed.
+_COMPILED_QSS = re.sub(
+    r"\s+", " ", re.sub(r"/\*.*?\*/", "", DARK_THEME_QSS, flags=re.S)
+).strip()
+
 
 def apply_dark_theme(app: "QApplication") -> None:
     """
@@ -229,6 +236,6 @@ def apply_dark_theme(app: "QApplication") -> None:
     """
     logger.info("Applying dark theme QSS to the application.")
     try:
-        app.setStyleSheet(DARK_THEME_QSS)
+        app.setStyleSheet(_COMPILED_QSS)
     except Exception as e:
         logger.error(f"Failed to apply stylesheet: {e}", exc_info=True)
\ No newline at end of file
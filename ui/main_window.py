@@ -5,17 +5,14 @@ for user interaction.
 """
 
 import logging
-import os
-from typing import Any, Dict, Optional
-
-# Import the PDF reading library!
-import fitz  # PyMuPDF
+from typing import Any, Dict, List, Optional
 
 from PySide6.QtCore import (
     QItemSelection,
     QSortFilterProxyModel,
     Qt,
     QThread,
+    QTimer,
     Signal,
     Slot,
 )
@@ -41,6 +38,7 @@ from PySide6.QtWidgets import (
 )
 
 import config
+from core.agents.qualifier_agent import AnalyzedJob
 from core.worker import Worker
 
 logger = logging.getLogger(__name__)
@@ -55,7 +53,7 @@ class MainWindow(QMainWindow):
     worker thread for non-blocking operations.
     """
 
-    # Signal to start the worker's scan process, carrying the resume content.
+    # Signal to start the worker's scan process, carrying the resume file path.
     start_worker_scan = Signal(str)
 
     # Column indices for the results table for easier access
@@ -64,6 +62,10 @@ class MainWindow(QMainWindow):
     COL_COMPANY = 2
     COL_SOURCE = 3
 
+    # How long, in milliseconds, incoming jobs are collected before they are
+    # inserted into the table together.
+    ROW_FLUSH_INTERVAL_MS = 150
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
         Initializes the MainWindow.
@@ -80,6 +82,18 @@ class MainWindow(QMainWindow):
         self._worker: Optional[Worker] = None
         self._worker_thread: Optional[QThread] = None
 
+        # Jobs waiting to be inserted into the table by `_flush_pending_rows`.
+        self._pending_jobs: List[AnalyzedJob] = []
+        self._row_flush_timer = QTimer(self)
+        self._row_flush_timer.setSingleShot(True)
+        self._row_flush_timer.setInterval(self.ROW_FLUSH_INTERVAL_MS)
+        self._row_flush_timer.timeout.connect(self._flush_pending_rows)
+
+        # The jobs shown in the table. Rows only hold their integer key, so
+        # the model stays small however long the cover letters are.
+        self._job_store: Dict[int, AnalyzedJob] = {}
+        self._next_job_id = 0
+
         self._init_ui()
         self._init_worker()
         self._connect_signals()
@@ -126,10 +140,7 @@ class MainWindow(QMainWindow):
         results_group.setLayout(results_layout)
 
         self.job_table_view = QTableView()
-        self.job_table_model = QStandardItemModel(0, 4)
-        self.job_table_model.setHorizontalHeaderLabels(
-            ["Score", "Title", "Company", "Source"]
-        )
+        self.job_table_model = self._make_empty_model()
 
         self.proxy_model = QSortFilterProxyModel()
         self.proxy_model.setSourceModel(self.job_table_model)
@@ -140,8 +151,10 @@ class MainWindow(QMainWindow):
             QTableView.SelectionBehavior.SelectRows
         )
         self.job_table_view.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        # Interactive, not ResizeToContents: the latter re-measures every column
+        # on each inserted row. Columns are fitted once per scan instead.
         self.job_table_view.horizontalHeader().setSectionResizeMode(
-            QHeaderView.ResizeMode.ResizeToContents
+            QHeaderView.ResizeMode.Interactive
         )
         self.job_table_view.horizontalHeader().setStretchLastSection(True)
         self.job_table_view.sortByColumn(self.COL_SCORE, Qt.SortOrder.DescendingOrder)
@@ -183,18 +196,28 @@ class MainWindow(QMainWindow):
 
         # --- Status Bar ---
         self.status_bar = self.statusBar()
-        self.status_label = QLabel("Ready.")
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
         self.progress_bar.setValue(0)
         self.progress_bar.setVisible(False)
-        self.status_bar.addPermanentWidget(self.status_label, 1)
         self.status_bar.addPermanentWidget(self.progress_bar)
+        self.status_bar.showMessage("Ready.")
 
         # --- Final Layout Assembly ---
         main_layout.addWidget(controls_group)
         main_layout.addWidget(splitter)
 
+    def _make_empty_model(self) -> QStandardItemModel:
+        """
+        Creates an empty model for the results table, with its headers set.
+
+        Returns:
+            QStandardItemModel: The new model.
+        """
+        model = QStandardItemModel(0, 4)
+        model.setHorizontalHeaderLabels(["Score", "Title", "Company", "Source"])
+        return model
+
     def _init_worker(self) -> None:
         """Initializes the background worker and its thread."""
         logger.debug("Initializing worker thread.")
@@ -219,7 +242,7 @@ class MainWindow(QMainWindow):
         self.start_worker_scan.connect(self._worker.run_scan)
 
         # Worker to main window slots
-        self._worker.job_found.connect(self.add_job_to_table)
+        self._worker.jobs_found_batch.connect(self.add_jobs_to_table)
         self._worker.progress_updated.connect(self.update_progress)
         self._worker.status_updated.connect(self.update_status)
         self._worker.finished.connect(self.scan_finished)
@@ -237,95 +260,94 @@ class MainWindow(QMainWindow):
             self.resume_path_edit.setText(config.RESUME_FILE_PATH)
             logger.info(f"Loaded default resume path: {config.RESUME_FILE_PATH}")
 
-    def _read_resume_content(self) -> str:
-        """
-        Reads the content of the resume file specified in the UI.
-        Supports .pdf, .txt, and .md files.
-
-        Returns:
-            str: The content of the resume file, or an empty string if the
-                 path is invalid or the file cannot be read.
-        """
-        resume_path = self.resume_path_edit.text()
-        if not resume_path or not os.path.exists(resume_path):
-            logger.warning(f"Resume file not found at: {resume_path}")
-            # Don't show a pop-up error here, just proceed without it.
-            # The user will be notified if they click "Start Scan" with a bad path.
-            if self.start_scan_button.isEnabled():  # only show error if they are about to scan
-                self.handle_error("Resume file not found. Analysis will proceed without it.")
-            return ""
-
-        try:
-            if resume_path.lower().endswith('.pdf'):
-                logger.info(f"Reading PDF resume from: {resume_path}")
-                text = ""
-                with fitz.open(resume_path) as doc:
-                    for page in doc:
-                        text += page.get_text()
-                return text
-            elif resume_path.lower().endswith(('.txt', '.md')):
-                logger.info(f"Reading text resume from: {resume_path}")
-                with open(resume_path, "r", encoding="utf-8") as f:
-                    return f.read()
-            else:
-                logger.warning(f"Unsupported resume file type: {resume_path}")
-                self.handle_error(
-                    "Unsupported resume file type. Please use .pdf, .txt, or .md."
-                )
-                return ""
-        except Exception as e:
-            logger.error(f"Error reading resume file {resume_path}: {e}", exc_info=True)
-            self.handle_error(f"Could not read resume file: {e}")
-            return ""
-
     @Slot()
     def start_scan(self) -> None:
         """Prepares for and starts a new scan."""
         logger.info("'Start Scan' button clicked.")
 
-        resume_content = self._read_resume_content()
-        # Check if the path is valid before disabling buttons and starting
-        resume_path = self.resume_path_edit.text()
-        if not resume_content and resume_path:
-            # This means reading the file failed or it was empty. An error was already shown.
-            # We allow the scan to proceed without a resume.
-            pass
-
         self.start_scan_button.setEnabled(False)
         self.stop_scan_button.setEnabled(True)
         self.progress_bar.setVisible(True)
-        self.job_table_model.removeRows(0, self.job_table_model.rowCount())
+        self._row_flush_timer.stop()
+        self._pending_jobs.clear()
+        # Rows stream in during the scan; sort them once, in `scan_finished`.
+        self.proxy_model.setDynamicSortFilter(False)
+        # Swapping in an empty model resets the proxy once, where removeRows
+        # would update its row mapping piece by piece.
+        new_model = self._make_empty_model()
+        self.proxy_model.setSourceModel(new_model)
+        self.job_table_model = new_model
+        self._job_store = {}
         self.update_status("Starting scan...")
-        self.start_worker_scan.emit(resume_content)
+        # The worker reads the file, so the GUI never blocks on it.
+        self.start_worker_scan.emit(self.resume_path_edit.text())
 
     @Slot()
     def scan_finished(self) -> None:
         """Handles the completion of a scan."""
         logger.info("Scan finished signal received.")
+        self._row_flush_timer.stop()
+        self._flush_pending_rows()
+        self.proxy_model.setDynamicSortFilter(True)
+        self.proxy_model.invalidate()
+        header = self.job_table_view.horizontalHeader()
+        self.job_table_view.sortByColumn(
+            header.sortIndicatorSection(), header.sortIndicatorOrder()
+        )
+        self.job_table_view.resizeColumnsToContents()
         self.start_scan_button.setEnabled(True)
         self.stop_scan_button.setEnabled(False)
         self.progress_bar.setVisible(False)
         self.update_status("Scan complete.")
 
-    @Slot(dict)
-    def add_job_to_table(self, job_data: Dict[str, Any]) -> None:
+    @Slot(list)
+    def add_jobs_to_table(self, jobs: List[AnalyzedJob]) -> None:
         """
-        Adds a new job prospect to the results table.
+        Adds a batch of new job prospects to the results table.
+
+        The rows are inserted shortly afterwards, together with any other jobs
+        that arrive within `ROW_FLUSH_INTERVAL_MS` (see `_flush_pending_rows`).
 
         Args:
-            job_data (Dict[str, Any]): A dictionary containing the analyzed job data.
+            jobs (List[AnalyzedJob]): The analyzed jobs to add.
+        """
+        self._pending_jobs.extend(jobs)
+        if not self._row_flush_timer.isActive():
+            self._row_flush_timer.start()
+
+    @Slot()
+    def _flush_pending_rows(self) -> None:
         """
-        logger.debug(f"Adding job to table: {job_data.get('title')}")
-        score_item = QStandardItem(str(job_data.get("score", 0)))
-        score_item.setData(job_data, Qt.ItemDataRole.UserRole)  # Store full dict
+        Inserts all pending jobs into the results table in one model update.
 
-        title_item = QStandardItem(job_data.get("title", "N/A"))
-        company_item = QStandardItem(job_data.get("company_name", "N/A"))
-        source_item = QStandardItem(job_data.get("source", "N/A"))
+        The rows are inserted at once, so the table is laid out once per flush
+        instead of once per job. While a scan runs, the proxy model's dynamic
+        sorting is off (see `start_scan`), so new rows are appended unsorted
+        and `scan_finished` sorts the table once.
+        """
+        jobs, self._pending_jobs = self._pending_jobs, []
+        if not jobs:
+            return
 
-        self.job_table_model.appendRow(
-            [score_item, title_item, company_item, source_item]
-        )
+        logger.debug("Adding %d job(s) to table.", len(jobs))
+        first_row = self.job_table_model.rowCount()
+        self.job_table_model.insertRows(first_row, len(jobs))
+        for row, job in enumerate(jobs, start=first_row):
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            self._job_store[job_id] = job
+
+            # An int, not its string, so the column sorts numerically.
+            score_item = QStandardItem()
+            score_item.setData(job.score, Qt.ItemDataRole.DisplayRole)
+            score_item.setData(job_id, Qt.ItemDataRole.UserRole)  # Key into _job_store
+
+            self.job_table_model.setItem(row, self.COL_SCORE, score_item)
+            self.job_table_model.setItem(row, self.COL_TITLE, QStandardItem(job.title))
+            self.job_table_model.setItem(
+                row, self.COL_COMPANY, QStandardItem(job.company_name or "N/A")
+            )
+            self.job_table_model.setItem(row, self.COL_SOURCE, QStandardItem(job.source))
 
     @Slot(int)
     def update_progress(self, value: int) -> None:
@@ -340,12 +362,12 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def update_status(self, message: str) -> None:
         """
-        Updates the status label in the status bar.
+        Updates the message shown in the status bar.
 
         Args:
             message (str): The new status message to display.
         """
-        self.status_label.setText(message)
+        self.status_bar.showMessage(message)
 
     @Slot(str)
     def handle_error(self, error_message: str) -> None:
@@ -374,26 +396,29 @@ class MainWindow(QMainWindow):
             selected (QItemSelection): The newly selected items.
             deselected (QItemSelection): The previously selected items.
         """
-        if not selected.indexes():
+        # The score cell holds the job's key, whichever cell was clicked.
+        selected_rows = self.job_table_view.selectionModel().selectedRows(self.COL_SCORE)
+        if not selected_rows:
             return
 
-        source_index = selected.indexes()[0]
-        proxy_index = self.proxy_model.mapToSource(source_index)
-        item = self.job_table_model.itemFromIndex(proxy_index)
+        source_index = self.proxy_model.mapToSource(selected_rows[0])
+        item = self.job_table_model.itemFromIndex(source_index)
 
         if not item:
             return
 
-        job_data: Dict[str, Any] = item.data(Qt.ItemDataRole.UserRole)
-        logger.debug(f"Displaying details for: {job_data.get('title')}")
+        job = self._job_store.get(item.data(Qt.ItemDataRole.UserRole))
+        if job is None:
+            return
+        logger.debug("Displaying details for: %s", job.title)
 
-        self.title_label.setText(job_data.get("title", "N/A"))
-        url = job_data.get("url", "#")
+        self.title_label.setText(job.title)
+        url = job.url or "#"
         self.url_label.setText(f'<a href="{url}">{url}</a>')
-        self.company_label.setText(job_data.get("company_name", "N/A"))
-        self.contact_label.setText(job_data.get("contact_info", "N/A"))
-        self.justification_edit.setText(job_data.get("justification", ""))
-        self.cover_letter_edit.setText(job_data.get("cover_letter", ""))
+        self.company_label.setText(job.company_name or "N/A")
+        self.contact_label.setText(job.contact_info or "N/A")
+        self.justification_edit.setText(job.justification)
+        self.cover_letter_edit.setText(job.cover_letter)
 
     @Slot()
     def browse_for_resume(self) -> None: